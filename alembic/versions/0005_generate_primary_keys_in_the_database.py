@@ -0,0 +1,34 @@
+"""generate primary keys in the database
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-14 04:39:56.976952
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# gen_random_uuid() is built into PostgreSQL 13 and later.
+_TABLES = ("users", "tweets", "retweets", "likes")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        op.alter_column(table, "id", server_default=None)
@@ -0,0 +1,34 @@
+"""index replies by parent tweet
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-14 05:40:12.384710
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, Sequence[str], None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_tweets_parent_created_id",
+        "tweets",
+        ["parent_tweet_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tweets_parent_created_id", table_name="tweets")
@@ -9,5 +9,9 @@ class InvalidToken(NotAuthenticated):
     DETAIL = "Invalid refresh token."
 
 
+class TokenExpired(NotAuthenticated):
+    DETAIL = "Access token has expired."
+
+
 class AuthorizationFailed(PermissionDenied):
     DETAIL = "Authorization failed."
@@ -1,43 +1,57 @@
-import datetime
-from datetime import timedelta
+import threading
+import time
 
-from fastapi import Depends
+import jwt
+from cachetools import TTLCache
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
 
-from src import models
 from src.auth import schemas
-from src.auth.exceptions import InvalidCredentials, InvalidToken
+from src.auth.exceptions import InvalidCredentials, InvalidToken, TokenExpired
 from src.config import settings
-from src.database import get_db
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
+_SECRET_KEY = settings.secret_key
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [_ALGORITHM]
+_EXPIRE_SECONDS = settings.access_token_expire_minutes * 60
+_DECODE_OPTIONS = {"require": ["exp", "user_id"]}
+
+# Verified tokens mapped to (TokenData, exp). Entries never outlive the token
+# lifetime, and the token's own `exp` claim is re-checked on every hit.
+_verified_tokens = TTLCache(maxsize=4096, ttl=_EXPIRE_SECONDS)
+_verified_tokens_lock = threading.Lock()
+
 
 def create_access_token(data: dict):
-    to_encode = data.copy()
-    expire = datetime.datetime.now(datetime.timezone.utc) + timedelta(
-        minutes=settings.access_token_expire_minutes
-    )
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.secret_key, algorithm=settings.algorithm
-    )
-    return encoded_jwt
+    to_encode = {**data, "exp": int(time.time()) + _EXPIRE_SECONDS}
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=_ALGORITHM)
 
 
 def verify_access_token(token: str):
+    with _verified_tokens_lock:
+        cached = _verified_tokens.get(token)
+    if cached is not None:
+        token_data, expires_at = cached
+        if expires_at > time.time():
+            return token_data
+        with _verified_tokens_lock:
+            _verified_tokens.pop(token, None)
+
     try:
         payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
+            token, _SECRET_KEY, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS
         )
-        id: str = payload.get("user_id")
-        if not id:
-            raise InvalidToken
+    except jwt.ExpiredSignatureError:
+        raise TokenExpired
+    except jwt.MissingRequiredClaimError:
+        raise InvalidToken
+    except jwt.PyJWTError:
+        raise InvalidCredentials
 
-        token_data = schemas.TokenData(id=id)
+    token_data = schemas.TokenData(id=payload["user_id"])
 
-    except JWTError:
-        raise InvalidCredentials
+    expires_at = payload["exp"]
+    with _verified_tokens_lock:
+        _verified_tokens[token] = (token_data, expires_at)
     return token_data
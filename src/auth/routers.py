@@ -1,6 +1,7 @@
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security.oauth2 import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import models, utils
 from src.auth import jwt
@@ -10,20 +11,27 @@ from src.users.email import send_account_verification_email
 
 router = APIRouter(prefix="", tags=["Authentication"])
 
+# Verified against when no account matches, so a missing user costs the same
+# bcrypt round as a wrong password.
+_DUMMY_HASH = utils.hash("dummy-password")
+
 
 @router.post("/login")
 async def login(
     background_tasks: BackgroundTasks,
     user_credentials: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Handles user login by verifying credentials and returning an access token.
 
+    Exactly one bcrypt verification runs whether or not the account exists, so
+    response timing does not reveal which emails are registered.
+
     Args:
         background_tasks (BackgroundTasks): FastAPI background task manager for sending email asynchronously.
         user_credentials (OAuth2PasswordRequestForm): Dependency injection for form data. Includes 'username' (user's email) and 'password'.
-        db (Session): Dependency to get the database session for performing database operations.
+        db (AsyncSession): Dependency to get the database session for performing database operations.
 
     Returns:
         dict: If login is successful, returns an access token and its type (bearer). If email is not verified, sends a verification email and returns a message.
@@ -32,24 +40,27 @@ async def login(
         InvalidCredentials: If the email is not found or the password is incorrect.
     """
     user = (
-        db.query(models.User)
-        .filter(models.User.email == user_credentials.username)
-        .first()
-    )
-    if not user:
+        await db.execute(
+            select(models.User).where(models.User.email == user_credentials.username)
+        )
+    ).scalar_one_or_none()
+    if user is None:
+        utils.verify(user_credentials.password, _DUMMY_HASH)
+        raise InvalidCredentials
+
+    valid, new_hash = utils.verify_and_update(user_credentials.password, user.password)
+    if not valid:
         raise InvalidCredentials
+    if new_hash is not None:
+        user.password = new_hash
+        await db.commit()
 
     if user.verified_on is None:
-        await send_account_verification_email(
-            user=user, background_tasks=background_tasks
-        )
+        send_account_verification_email(user=user, background_tasks=background_tasks)
         return {
             "message": "You have to verify your email before logging in. Check your email for verification link."
         }
 
-    if not utils.verify(user_credentials.password, user.password):
-        raise InvalidCredentials
-
     access_token = jwt.create_access_token(data={"user_id": str(user.email)})
 
     return {"access_token": access_token, "token_type": "bearer"}
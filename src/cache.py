@@ -0,0 +1,89 @@
+from typing import Any, Awaitable, Callable
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config import settings
+from src.logger import get_logger
+
+logger = get_logger()
+
+# Caching is optional: without REDIS_URL every lookup falls through to the
+# database, so local development and tests need no Redis server.
+_client: Redis | None = (
+    Redis.from_url(settings.redis_url) if settings.redis_url else None
+)
+
+# Generation counters outlive any cached value by a wide margin, so an
+# expired counter can never resurrect a stale entry.
+_GENERATION_TTL = 24 * 60 * 60
+
+
+def _generation_key(namespace: str, id: Any) -> str:
+    return f"{namespace}:gen:{id}"
+
+
+async def versioned_key(name: str, namespace: str, *ids: Any) -> str:
+    """Build a cache key for `name` that embeds each id's current generation.
+
+    Bumping an id's generation in `namespace` (see `bump_generations`) makes
+    every key built from the old generation unreachable, which invalidates
+    all entries involving that id without tracking the keys themselves.
+    """
+    generations = [0] * len(ids)
+    if _client is not None:
+        try:
+            values = await _client.mget([_generation_key(namespace, id) for id in ids])
+            generations = [int(value or 0) for value in values]
+        except RedisError:
+            logger.warning(f"Cache generation lookup failed for {namespace}")
+    parts = ":".join(f"{id}.{gen}" for id, gen in zip(ids, generations))
+    return f"{name}:{parts}"
+
+
+async def bump_generations(namespace: str, *ids: Any):
+    if _client is None:
+        return
+    try:
+        async with _client.pipeline(transaction=False) as pipe:
+            for id in ids:
+                key = _generation_key(namespace, id)
+                pipe.incr(key)
+                pipe.expire(key, _GENERATION_TTL)
+            await pipe.execute()
+    except RedisError:
+        logger.warning(f"Cache invalidation failed for {namespace}: {ids}")
+
+
+async def get_or_set(
+    key: str,
+    ttl: int,
+    compute: Callable[[], Awaitable[Any]],
+    adapter: TypeAdapter,
+) -> Any:
+    """Return the cached value for `key`, computing and storing it on a miss.
+
+    Values are stored with `adapter.dump_json` and rebuilt from the cached
+    bytes with `adapter.validate_json`, so hits come back as the same models
+    and types a miss returns.
+
+    Redis errors are logged and treated as a miss so an unavailable cache
+    never fails the request.
+    """
+    if _client is None:
+        return await compute()
+
+    try:
+        cached = await _client.get(key)
+        if cached is not None:
+            return adapter.validate_json(cached)
+    except RedisError:
+        logger.warning(f"Cache read failed for {key}")
+
+    value = await compute()
+    try:
+        await _client.set(key, adapter.dump_json(value), ex=ttl)
+    except RedisError:
+        logger.warning(f"Cache write failed for {key}")
+    return value
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -26,7 +28,18 @@ class Settings(BaseSettings):
 
     app_name: str
 
+    redis_url: str | None = None
+    # Comma-separated list of allowed browser origins.
+    cors_origins: str = "*"
+    # Prefix for stored media URLs; point it at a CDN in front of /static.
+    media_base_url: str = "http://localhost:8000"
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
+
+settings = get_settings()
@@ -1,21 +1,66 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 
 from src.config import settings
+from src.logger import get_logger
+
+logger = get_logger()
+
+DATABASE_URL = f"postgresql+asyncpg://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_port}/{settings.database_name}"
 
-DATABASE_URL = f"postgresql://{settings.database_username}:{settings.database_password}@{settings.database_hostname}:{settings.database_port}/{settings.database_name}"
+POOL_SIZE = 20
 
-engine = create_engine(DATABASE_URL)
+# A burst beyond pool_size + max_overflow waits at most pool_timeout seconds
+# for a connection and then fails fast, rather than queueing indefinitely.
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=POOL_SIZE,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    query_cache_size=1200,
+)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Objects stay loaded after commit so handlers can return them without an
+# extra SELECT; call db.refresh() where server-side values are needed.
+SessionLocal = async_sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
+async def warm_pool():
+    """Open POOL_SIZE connections at startup so early requests skip the connect.
+
+    Best effort: if the database is unreachable the app still starts, and
+    connections are made on demand as before.
+    """
+
+    async def connect():
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
 
     try:
+        await asyncio.gather(*(connect() for _ in range(POOL_SIZE)))
+    except Exception as e:
+        logger.warning(f"Connection pool warm-up failed: {e}")
+
+
+def pool_stats():
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
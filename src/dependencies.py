@@ -1,14 +1,68 @@
+import threading
+from collections import namedtuple
+
+from cachetools import TTLCache
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import models
+from src.auth.exceptions import InvalidCredentials
 from src.auth.jwt import oauth2_scheme, verify_access_token
 from src.database import get_db
 
+# Lightweight stand-in for the authenticated user. Most routes only need the
+# id, so caching this instead of a Session-bound User avoids detached-instance
+# problems and a users lookup on every request.
+CurrentUser = namedtuple("CurrentUser", "id email")
+
+_current_users = TTLCache(maxsize=2048, ttl=60)
+_current_users_lock = threading.Lock()
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
+):
+    # Always verify first so an expired token is rejected even while its user
+    # is still cached; the cache only saves the users SELECT.
+    token_data = verify_access_token(token)
+    with _current_users_lock:
+        cached = _current_users.get(token)
+    if cached is not None:
+        return cached
+
+    # The token carries the email, so only the id needs to be looked up.
+    user_id = await db.scalar(
+        select(models.User.id).where(models.User.email == token_data.id)
+    )
+    if user_id is None:
+        raise InvalidCredentials
+
+    current_user = CurrentUser(id=user_id, email=token_data.id)
+    with _current_users_lock:
+        _current_users[token] = current_user
+    return current_user
+
+
+def _cache_clear_for(token: str):
+    """Drop the cached user for `token`.
+
+    Logout and password changes call this so the token stops resolving from
+    this worker's cache at once, instead of for up to the cache TTL.
+    """
+    with _current_users_lock:
+        _current_users.pop(token, None)
+
+
+get_current_user.cache_clear_for = _cache_clear_for
+
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+async def get_current_user_model(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
-    token = verify_access_token(token)
-    user_obj = db.query(models.User).filter(models.User.email == token.id).first()
-    return user_obj
+    """Load the full User row for routes that serialize the authenticated user."""
+    user = await db.get(models.User, current_user.id)
+    if user is None:
+        raise InvalidCredentials
+    return user
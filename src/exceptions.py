@@ -25,6 +25,10 @@ class BadRequest(DetailedHTTPException):
     DETAIL = "Bad Request"
 
 
+class InvalidCursor(BadRequest):
+    DETAIL = "Invalid pagination cursor."
+
+
 class NotAuthenticated(DetailedHTTPException):
     STATUS_CODE = status.HTTP_401_UNAUTHORIZED
     DETAIL = "User not authenticated"
@@ -18,3 +18,7 @@ class FollowNotExists(BadRequest):
 
 class SelfFollowException(BadRequest):
     DETAIL = "Cannot follow/unfollow yourself"
+
+
+class SuggestionsUnavailable(DetailedHTTPException):
+    DETAIL = "An error occurred while fetching follow suggestions"
@@ -1,12 +1,17 @@
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
-from src.dependencies import get_current_user
+from src.dependencies import CurrentUser, get_current_user
 from src.follow import schemas, service
+from src.follow.exceptions import SuggestionsUnavailable
+from src.logger import get_logger
+
+logger = get_logger()
 
 router = APIRouter(prefix="/follow", tags=["Follow"])
 
@@ -14,8 +19,8 @@ router = APIRouter(prefix="/follow", tags=["Follow"])
 @router.post("/{user_id}", status_code=status.HTTP_201_CREATED)
 async def follow_user(
     user_id: uuid.UUID,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Follow a specific user.
 
@@ -23,8 +28,8 @@ async def follow_user(
 
     Args:
         user_id (uuid.UUID): The unique ID of the user to follow.
-        db (Session): Database session instance.
-        current_user (User): The authenticated user making the request.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user making the request.
 
     Returns:
         dict: A dictionary containing a success message with the followed user's username.
@@ -58,16 +63,18 @@ async def follow_user(
 
 @router.delete("/{user_id}", status_code=status.HTTP_200_OK)
 async def unfollow_user(
-    user_id: str, db: Session = Depends(get_db), current_user=Depends(get_current_user)
+    user_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Unfollow a user.
 
     Removes an existing follow relationship between the authenticated user and the target user.
 
     Args:
-        user_id (str): The unique identifier of the user to unfollow.
-        db (Session): Database session instance.
-        current_user (User): The authenticated user making the request.
+        user_id (uuid.UUID): The unique identifier of the user to unfollow.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user making the request.
 
     Returns:
         dict: A dictionary containing a success message with the unfollowed user's username.
@@ -102,12 +109,15 @@ async def unfollow_user(
 @router.get(
     "/followers",
     status_code=status.HTTP_200_OK,
-    response_model=schemas.FollowersDetailsResponse,
+    response_model=schemas.FollowersDetailsResponse | schemas.FollowCountResponse,
 )
 async def get_followers(
     user_id: uuid.UUID | None = None,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    count_only: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve a list of followers.
 
@@ -116,11 +126,17 @@ async def get_followers(
     Args:
         user_id (uuid.UUID, optional): The ID of the user whose followers to retrieve.
             If None, returns followers of the authenticated user.
-        current_user (User): The authenticated user making the request.
-        db (Session): Database session instance.
+        cursor (str, optional): Opaque cursor from a previous response's
+            `next_cursor`. Omit to start from the most recent follower.
+        limit (int): Maximum followers to return. Range: 1-100. Defaults to 50.
+        count_only (bool, optional): Return only the number of followers, as
+            ``{"count": n}``, without loading the list. Defaults to False.
+        current_user (CurrentUser): The authenticated user making the request.
+        db (AsyncSession): Database session instance.
 
     Returns:
-        FollowersDetailsResponse: A Pydantic model containing a list of follower details.
+        FollowersDetailsResponse | FollowCountResponse: A Pydantic model containing a
+            list of follower details, or the follower count when `count_only` is set.
             Example::
 
                 {
@@ -132,15 +148,18 @@ async def get_followers(
                             "profile_image_url": "http://example.com/lazy.jpg",
                             "is_followed": true
                         }
-                    ]
+                    ],
+                    "next_cursor": "MjAyNC0wMy0xNVQxNTowMDowMCswMDowMHw0NTZl..."
                 }
 
     Raises:
         HTTPException:
+            - 400: Malformed cursor
             - 404: Specified user not found
 
     Note:
         - The `is_followed` field indicates whether the authenticated user follows each follower
+        - Followers are returned newest first; `next_cursor` is null on the last page
         - This endpoint requires authentication
 
     Example:
@@ -160,31 +179,44 @@ async def get_followers(
                 headers={"Authorization": "Bearer <token>"}
             )
     """
-    return await service.get_followers_details(user_id, current_user.id, db)
+    if count_only:
+        return await service.get_followers_count(user_id, current_user.id, db)
+    return await service.get_followers_details(
+        user_id, current_user.id, db, cursor=cursor, limit=limit
+    )
 
 
 @router.get(
     "/following",
     status_code=status.HTTP_200_OK,
-    response_model=schemas.FollowingDetailsResponse,
+    response_model=schemas.FollowingDetailsResponse | schemas.FollowCountResponse,
 )
 async def get_following(
-    user_id: str | None = None,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    user_id: uuid.UUID | None = None,
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    count_only: bool = False,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """Retrieve a list of followed users.
 
     Gets a list of users followed by either the authenticated user or a specified user.
 
     Args:
-        user_id (str, optional): The ID of the user whose following list to retrieve.
+        user_id (uuid.UUID, optional): The ID of the user whose following list to retrieve.
             If None, returns the authenticated user's following list.
-        current_user (User): The authenticated user making the request.
-        db (Session): Database session instance.
+        cursor (str, optional): Opaque cursor from a previous response's
+            `next_cursor`. Omit to start from the most recently followed user.
+        limit (int): Maximum users to return. Range: 1-100. Defaults to 50.
+        count_only (bool, optional): Return only the number of followed users, as
+            ``{"count": n}``, without loading the list. Defaults to False.
+        current_user (CurrentUser): The authenticated user making the request.
+        db (AsyncSession): Database session instance.
 
     Returns:
-        FollowingDetailsResponse: A Pydantic model containing a list of following details.
+        FollowingDetailsResponse | FollowCountResponse: A Pydantic model containing a
+            list of following details, or the following count when `count_only` is set.
             Example::
 
                 {
@@ -196,15 +228,18 @@ async def get_following(
                             "profile_image_url": "http://example.com/me.jpg",
                             "is_followed": true
                         }
-                    ]
+                    ],
+                    "next_cursor": "MjAyNC0wMy0xNVQxNTowMDowMCswMDowMHw0NTZl..."
                 }
 
     Raises:
         HTTPException:
+            - 400: Malformed cursor
             - 404: Specified user not found
 
     Note:
         - The `is_followed` field indicates whether the authenticated user follows each user
+        - Users are returned most recently followed first; `next_cursor` is null on the last page
         - This endpoint requires authentication
 
     Example:
@@ -224,7 +259,11 @@ async def get_following(
                 headers={"Authorization": "Bearer <token>"}
             )
     """
-    return await service.get_following_details(user_id, current_user.id, db)
+    if count_only:
+        return await service.get_following_count(user_id, current_user.id, db)
+    return await service.get_following_details(
+        user_id, current_user.id, db, cursor=cursor, limit=limit
+    )
 
 
 @router.get(
@@ -234,18 +273,19 @@ async def get_following(
     description="Returns a list of users that the current user might want to follow",
 )
 async def follow_suggestions(
-    current_user: uuid.UUID = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    limit: int = 5,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    limit: int = Query(5, ge=1, le=50),
 ):
     """Get user follow suggestions.
 
     Provides a list of suggested users that the authenticated user might want to follow.
 
     Args:
-        current_user (uuid.UUID): The authenticated user's ID.
-        db (Session): Database session instance.
-        limit (int, optional): Maximum number of suggestions to return. Defaults to 5.
+        current_user (CurrentUser): The authenticated user making the request.
+        db (AsyncSession): Database session instance.
+        limit (int, optional): Maximum number of suggestions to return. Range: 1-50.
+            Defaults to 5.
 
     Returns:
         List[FollowSuggestionsResponse]: A list of Pydantic models containing user suggestions.
@@ -288,18 +328,9 @@ async def follow_suggestions(
             )
     """
     try:
-        suggestions = await service.get_follow_suggestions(
+        return await service.get_follow_suggestions(
             current_user_id=current_user.id, db=db, limit=limit
         )
-
-        if not suggestions:
-            return []
-
-        return suggestions
-
-    except Exception as e:
-        print(e)
-        raise HTTPException(
-            status_code=500,
-            detail="An error occurred while fetching follow suggestions",
-        )
+    except SQLAlchemyError:
+        logger.exception(f"Follow suggestions failed for user {current_user.id}")
+        raise SuggestionsUnavailable
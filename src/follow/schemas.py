@@ -15,16 +15,22 @@ class FollowUserDetails(BaseModel):
 
 class FollowersDetailsResponse(BaseModel):
     followers: List[FollowUserDetails]
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
 class FollowingDetailsResponse(BaseModel):
     following: List[FollowUserDetails]
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class FollowCountResponse(BaseModel):
+    count: int
+
+
 class FollowSuggestionsResponse(BaseModel):
     id: UUID
     full_name: str
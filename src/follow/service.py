@@ -1,10 +1,14 @@
-import random
 import uuid
+from typing import List
 
-from sqlalchemy import and_, not_, select
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import and_, delete, exists, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from src import models
+from src import cache, models, utils
 from src.follow import schemas
 from src.follow.exceptions import (
     FollowExists,
@@ -13,172 +17,341 @@ from src.follow.exceptions import (
     UserNotFound,
 )
 from src.logger import get_logger
+from src.tweets.service import HOME_CACHE_NAMESPACE
 
 logger = get_logger()
 
+# Follow lists change far less often than they are read. Entries are keyed
+# by the generations of both the listed user and the viewer, and
+# follow/unfollow bump both sides, so changes show up immediately; profile
+# edits may take up to the TTL to appear.
+_CACHE_NAMESPACE = "follow"
+_LIST_CACHE_TTL = 60
+_SUGGESTIONS_CACHE_TTL = 60
 
-async def follow_user(user_id: uuid.UUID, current_user_id: uuid.UUID, db: Session):
+# Rows come from typed columns, so responses are built with model_construct
+# and skip validation; cache hits are decoded back into the same models.
+_followers_adapter = TypeAdapter(schemas.FollowersDetailsResponse)
+_following_adapter = TypeAdapter(schemas.FollowingDetailsResponse)
+_suggestions_adapter = TypeAdapter(List[schemas.FollowSuggestionsResponse])
+
+
+async def follow_user(user_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession):
     if user_id == current_user_id:
         logger.warning(
             f"Follow failed: User {current_user_id} attempted to follow themselves"
         )
         raise SelfFollowException
-    followed_user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not followed_user:
-        logger.warning(f"Follow failed: Target user {user_id} not found")
-        raise UserNotFound(status_code=404, detail="User not found")
 
-    if (
-        db.query(models.Follow)
-        .filter(
-            models.Follow.follower_id == current_user_id,
-            models.Follow.followed_id == user_id,
+    # One round trip: the insert yields nothing on a duplicate follow, and
+    # the followed user's username is read back by joining on its result.
+    new_follow = (
+        insert(models.Follow)
+        .values(follower_id=current_user_id, followed_id=user_id)
+        .on_conflict_do_nothing()
+        .returning(models.Follow.followed_id)
+        .cte("new_follow")
+    )
+    try:
+        username = await db.scalar(
+            select(models.User.username).join(
+                new_follow, new_follow.c.followed_id == models.User.id
+            )
         )
-        .first()
-    ):
+        await db.commit()
+    except IntegrityError as e:
+        # With conflicts ignored, the users foreign key is the expected failure.
+        await db.rollback()
+        if not utils.is_foreign_key_violation(e):
+            raise
+        logger.warning(f"Follow failed: Target user {user_id} not found")
+        raise UserNotFound
+
+    if username is None:
         logger.warning(
             f"Follow failed: User {current_user_id} already follows {user_id}"
         )
         raise FollowExists
 
-    follow_entry = models.Follow(follower_id=current_user_id, followed_id=user_id)
-    db.add(follow_entry)
-    db.commit()
+    await cache.bump_generations(_CACHE_NAMESPACE, current_user_id, user_id)
+    await cache.bump_generations(HOME_CACHE_NAMESPACE, current_user_id)
     logger.info(f"User {current_user_id} successfully followed user {user_id}")
-    return {"message": f"You are now following {followed_user.username}"}
+    return {"message": f"You are now following {username}"}
 
 
-async def unfollow_user(user_id: uuid.UUID, current_user_id: uuid.UUID, db: Session):
+async def unfollow_user(
+    user_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
     if user_id == current_user_id:
         logger.warning(
             f"Unfollow failed: User {current_user_id} attempted to unfollow themselves"
         )
         raise SelfFollowException
-    followed_user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not followed_user:
-        logger.warning(f"Unfollow failed: Target user {user_id} not found")
-        raise UserNotFound
 
-    follow_relationship = (
-        db.query(models.Follow)
-        .filter(
+    removed_follow = (
+        delete(models.Follow)
+        .where(
             models.Follow.follower_id == current_user_id,
             models.Follow.followed_id == user_id,
         )
-        .first()
+        .returning(models.Follow.followed_id)
+        .cte("removed_follow")
     )
+    username = await db.scalar(
+        select(models.User.username).join(
+            removed_follow, removed_follow.c.followed_id == models.User.id
+        )
+    )
+    await db.commit()
 
-    if not follow_relationship:
+    if username is None:
+        # Nothing was deleted; only now pay for telling the two cases apart.
+        if not await db.scalar(select(exists().where(models.User.id == user_id))):
+            logger.warning(f"Unfollow failed: Target user {user_id} not found")
+            raise UserNotFound
         logger.warning(
             f"Unfollow failed: User {current_user_id} doesn't follow {user_id}"
         )
         raise FollowNotExists
 
-    db.delete(follow_relationship)
-    db.commit()
+    await cache.bump_generations(_CACHE_NAMESPACE, current_user_id, user_id)
+    await cache.bump_generations(HOME_CACHE_NAMESPACE, current_user_id)
     logger.info(f"User {current_user_id} successfully unfollowed user {user_id}")
-    return {"message": f"You have unfollowed {followed_user.username}"}
+    return {"message": f"You have unfollowed {username}"}
+
+
+def _follow_list(
+    listed_column,
+    owner_column,
+    user_id: uuid.UUID,
+    current_user_id: uuid.UUID,
+    cursor: str | None,
+    limit: int,
+):
+    """Select one page of the users on one side of `user_id`'s follow edges.
+
+    `owner_column` is the Follow column matched against `user_id` and
+    `listed_column` the column naming the users to return. `is_followed` is
+    resolved by an outer join against the current user's own follow edges
+    rather than a lookup per row. Pages are keyed on (Follow.created_at,
+    listed user id), newest first, and one extra row is fetched so the
+    caller can tell whether another page exists.
+    """
+    viewer_follow = aliased(models.Follow)
+    query = (
+        select(
+            models.User.id,
+            models.User.full_name,
+            models.User.username,
+            models.User.bio,
+            models.User.profile_image_url,
+            (viewer_follow.follower_id.is_not(None)).label("is_followed"),
+            models.Follow.created_at.label("followed_at"),
+        )
+        .join(models.Follow, listed_column == models.User.id)
+        .outerjoin(
+            viewer_follow,
+            and_(
+                viewer_follow.followed_id == models.User.id,
+                viewer_follow.follower_id == current_user_id,
+            ),
+        )
+        .where(owner_column == user_id)
+    )
+    if cursor:
+        after_created_at, after_id = utils.decode_cursor(cursor)
+        query = query.where(
+            tuple_(models.Follow.created_at, listed_column)
+            < tuple_(after_created_at, after_id)
+        )
+    return query.order_by(models.Follow.created_at.desc(), listed_column.desc()).limit(
+        limit + 1
+    )
+
+
+async def _follow_page(
+    listed_column,
+    owner_column,
+    user_id: uuid.UUID,
+    current_user_id: uuid.UUID,
+    cursor: str | None,
+    limit: int,
+    db: AsyncSession,
+):
+    rows = (
+        await db.execute(
+            _follow_list(
+                listed_column, owner_column, user_id, current_user_id, cursor, limit
+            )
+        )
+    ).all()
+    # A non-empty page already proves the user exists, so the lookup that
+    # tells an unknown user apart from an empty list only runs for empty ones.
+    if not rows and not await db.scalar(
+        select(exists().where(models.User.id == user_id))
+    ):
+        raise UserNotFound
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = utils.encode_cursor(rows[-1].followed_at, rows[-1].id)
+
+    users = [
+        schemas.FollowUserDetails.model_construct(
+            id=row.id,
+            full_name=row.full_name,
+            username=row.username,
+            bio=row.bio,
+            profile_image_url=row.profile_image_url,
+            is_followed=row.is_followed,
+        )
+        for row in rows
+    ]
+    return users, next_cursor
+
+
+async def _follow_count(owner_column, user_id: uuid.UUID, db: AsyncSession):
+    """Count the follow edges whose `owner_column` is `user_id`.
+
+    A count reads only the follows index; the user lookup is needed just to
+    tell an unknown user apart from one with no edges.
+    """
+    count = await db.scalar(
+        select(func.count()).select_from(models.Follow).where(owner_column == user_id)
+    )
+    if not count and not await db.scalar(
+        select(exists().where(models.User.id == user_id))
+    ):
+        raise UserNotFound
+    return schemas.FollowCountResponse.model_construct(count=count)
+
+
+async def get_followers_count(
+    user_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
+    return await _follow_count(
+        models.Follow.followed_id, user_id or current_user_id, db
+    )
+
+
+async def get_following_count(
+    user_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
+    return await _follow_count(
+        models.Follow.follower_id, user_id or current_user_id, db
+    )
 
 
 async def get_followers_details(
-    user_id: uuid.UUID, current_user_id: uuid.UUID, db: Session
+    user_id: uuid.UUID,
+    current_user_id: uuid.UUID,
+    db: AsyncSession,
+    cursor: str | None = None,
+    limit: int = 50,
 ):
     if not user_id:
         user_id = current_user_id
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise UserNotFound
 
-    followers = [follow.follower for follow in user.followers]
-    followers_details = []
-    for follower in followers:
-        is_followed = (
-            db.query(models.Follow)
-            .filter(
-                models.Follow.follower_id == current_user_id,
-                models.Follow.followed_id == follower.id,
-            )
-            .first()
-            is not None
-        )
-        followers_details.append(
-            schemas.FollowUserDetails(
-                id=follower.id,
-                full_name=follower.full_name,
-                username=follower.username,
-                bio=follower.bio,
-                profile_image_url=follower.profile_image_url,
-                is_followed=is_followed,
-            )
+    async def load():
+        followers, next_cursor = await _follow_page(
+            models.Follow.follower_id,
+            models.Follow.followed_id,
+            user_id,
+            current_user_id,
+            cursor,
+            limit,
+            db,
         )
-    return {"followers": followers_details}
+        return schemas.FollowersDetailsResponse.model_construct(
+            followers=followers, next_cursor=next_cursor
+        )
+
+    key = await cache.versioned_key(
+        f"followers:{limit}:{cursor}", _CACHE_NAMESPACE, user_id, current_user_id
+    )
+    return await cache.get_or_set(key, _LIST_CACHE_TTL, load, _followers_adapter)
 
 
 async def get_following_details(
-    user_id: uuid.UUID, current_user_id: uuid.UUID, db: Session
+    user_id: uuid.UUID,
+    current_user_id: uuid.UUID,
+    db: AsyncSession,
+    cursor: str | None = None,
+    limit: int = 50,
 ):
     if not user_id:
         user_id = current_user_id
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise UserNotFound
 
-    following = [follow.followed for follow in user.following]
-    following_details = []
-    for followed in following:
-        is_followed = (
-            db.query(models.Follow)
-            .filter(
-                models.Follow.follower_id == current_user_id,
-                models.Follow.followed_id == followed.id,
-            )
-            .first()
-            is not None
-        )
-
-        following_details.append(
-            schemas.FollowUserDetails(
-                id=followed.id,
-                full_name=followed.full_name,
-                username=followed.username,
-                bio=followed.bio,
-                profile_image_url=followed.profile_image_url,
-                is_followed=is_followed,
-            )
+    async def load():
+        following, next_cursor = await _follow_page(
+            models.Follow.followed_id,
+            models.Follow.follower_id,
+            user_id,
+            current_user_id,
+            cursor,
+            limit,
+            db,
+        )
+        return schemas.FollowingDetailsResponse.model_construct(
+            following=following, next_cursor=next_cursor
         )
-    return {"following": following_details}
+
+    key = await cache.versioned_key(
+        f"following:{limit}:{cursor}", _CACHE_NAMESPACE, user_id, current_user_id
+    )
+    return await cache.get_or_set(key, _LIST_CACHE_TTL, load, _following_adapter)
 
 
 async def get_follow_suggestions(
-    current_user_id: uuid.UUID, db: Session, limit: int = 5
+    current_user_id: uuid.UUID, db: AsyncSession, limit: int = 5
 ):
-    following_subquery = select(models.Follow.followed_id).where(
-        models.Follow.follower_id == current_user_id
+    key = await cache.versioned_key(
+        f"suggestions:{limit}", _CACHE_NAMESPACE, current_user_id
+    )
+    return await cache.get_or_set(
+        key,
+        _SUGGESTIONS_CACHE_TTL,
+        lambda: _load_follow_suggestions(current_user_id, db, limit),
+        _suggestions_adapter,
     )
 
-    query = select(
-        models.User.id,
-        models.User.full_name,
-        models.User.username,
-        models.User.profile_image_url,
-    ).where(
-        and_(
+
+async def _load_follow_suggestions(
+    current_user_id: uuid.UUID, db: AsyncSession, limit: int
+):
+    # Sample in SQL so only `limit` rows leave the database.
+    query = (
+        select(
+            models.User.id,
+            models.User.full_name,
+            models.User.username,
+            models.User.profile_image_url,
+        )
+        # Anti-join against the caller's own follow edges: NULL-safe, unlike
+        # NOT IN, and planned as a hash/merge anti-join.
+        .outerjoin(
+            models.Follow,
+            and_(
+                models.Follow.followed_id == models.User.id,
+                models.Follow.follower_id == current_user_id,
+            ),
+        )
+        .where(
             models.User.id != current_user_id,
-            not_(models.User.id.in_(following_subquery)),
+            models.Follow.follower_id.is_(None),
         )
+        .order_by(func.random())
+        .limit(limit)
     )
 
-    result = db.execute(query)
-    users = result.all()
-
-    suggested_users = random.sample(users, min(len(users), limit))
+    users = (await db.execute(query)).all()
 
     return [
-        dict(
+        schemas.FollowSuggestionsResponse.model_construct(
             id=user.id,
             full_name=user.full_name,
             username=user.username,
             profile_image_url=user.profile_image_url,
         )
-        for user in suggested_users
+        for user in users
     ]
@@ -1,11 +1,10 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src import models
 from src.database import get_db
-from src.dependencies import get_current_user
+from src.dependencies import CurrentUser, get_current_user
 from src.like import schemas, service
 
 router = APIRouter(prefix="/likes", tags=["Likes"])
@@ -16,8 +15,8 @@ router = APIRouter(prefix="/likes", tags=["Likes"])
 )
 async def create_like(
     like: schemas.LikeCreate,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Like a tweet.
 
@@ -26,8 +25,8 @@ async def create_like(
 
     Args:
         like (schemas.LikeCreate): Contains the ID of the tweet to like.
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user creating the like.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user creating the like.
 
     Returns:
         LikeResponse: Details of the created like interaction, including the new number of total likes.
@@ -53,8 +52,8 @@ async def create_like(
 @router.delete("/{tweet_id}", status_code=status.HTTP_200_OK)
 async def delete_like(
     tweet_id: UUID,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Unlike a previously liked tweet.
 
@@ -62,8 +61,8 @@ async def delete_like(
 
     Args:
         tweet_id (UUID): ID of the tweet to unlike.
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user removing the like.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user removing the like.
 
     Returns:
         dict: New Like Count.
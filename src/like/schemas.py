@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class LikeBase(BaseModel):
@@ -17,5 +17,4 @@ class LikeResponse(LikeBase):
     tweet_id: UUID
     like_count: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -1,69 +1,173 @@
 import uuid
 
-from sqlalchemy import func
+from sqlalchemy import column, delete, func, select, table, text, update, values
+from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src import models
+from src import models, utils
+from src.like import schemas
 from src.like.exceptions import AlreadyLiked, LikeNotFound, TweetNotFound
 from src.logger import get_logger
+from src.tweets.service import invalidate_home_feed
 
 logger = get_logger()
 
+# Bulk imports above this many likes are staged with COPY instead of being
+# sent as bound parameters.
+_COPY_THRESHOLD = 100
 
-async def create_like(tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: Session):
-    tweet = db.query(models.Tweet).filter(models.Tweet.id == tweet_id).first()
-    if not tweet:
+
+def _adjust_like_count(changed_like, delta):
+    """Update the like_count of the tweet named by the `changed_like` CTE.
+
+    The UPDATE only matches when the CTE produced a row, so a duplicate like
+    or a missing unlike leaves the counter untouched. Its row lock also
+    serializes concurrent likes on one tweet, keeping the counter exact.
+    """
+    return (
+        update(models.Tweet)
+        .where(models.Tweet.id == changed_like.c.tweet_id)
+        .values(like_count=models.Tweet.like_count + delta)
+        # The UPDATE's FROM names a CTE, which the ORM cannot evaluate to sync
+        # loaded objects; none are loaded here anyway.
+        .execution_options(synchronize_session=False)
+        .returning(models.Tweet.id, models.Tweet.like_count)
+    )
+
+
+async def create_like(
+    tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
+    # One round trip: a duplicate like inserts nothing and yields no row, and
+    # a missing tweet fails the foreign key. The id comes from the column's
+    # server default.
+    new_like = (
+        insert(models.Like)
+        .values(tweet_id=tweet_id, user_id=current_user_id)
+        .on_conflict_do_nothing()
+        .returning(models.Like.id, models.Like.tweet_id)
+        .cte("new_like")
+    )
+    counted = _adjust_like_count(new_like, 1).cte("counted")
+    try:
+        result = (
+            await db.execute(
+                select(new_like.c.id, new_like.c.tweet_id, counted.c.like_count).join(
+                    counted, counted.c.id == new_like.c.tweet_id
+                )
+            )
+        ).first()
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if not utils.is_foreign_key_violation(e):
+            raise
         logger.warning(f"Like creation failed: Tweet {tweet_id} not found")
         raise TweetNotFound
 
-    try:
-        db_like = models.Like(tweet_id=tweet_id, user_id=current_user_id)
-        db.add(db_like)
-        db.commit()
-        db.refresh(db_like)
-        like_count = (
-            db.query(func.count(models.Like.id))
-            .filter(models.Like.tweet_id == models.Like.tweet_id)
-            .scalar()
-        )
-        logger.info(f"User {current_user_id} successfully liked tweet {tweet_id}")
-        return {
-            "like_id": db_like.id,
-            "tweet_id": db_like.tweet_id,
-            "like_count": like_count,
-        }
-    except IntegrityError:
-        db.rollback()
+    if result is None:
         logger.warning(
             f"Like creation failed: User {current_user_id} already liked tweet {tweet_id}"
         )
         raise AlreadyLiked
 
+    # Success lines are on every request; %-style args defer the UUID
+    # formatting until a handler actually takes the record.
+    logger.info("User %s successfully liked tweet %s", current_user_id, tweet_id)
+    # The row comes from typed columns, so the response skips validation.
+    return schemas.LikeResponse.model_construct(
+        like_id=result.id, tweet_id=result.tweet_id, like_count=result.like_count
+    )
 
-async def delete_like(tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: Session):
-    like = (
-        db.query(models.Like)
-        .filter(
-            models.Like.tweet_id == tweet_id, models.Like.user_id == current_user_id
-        )
-        .first()
+
+async def delete_like(
+    tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
+    removed_like = (
+        delete(models.Like)
+        .where(models.Like.tweet_id == tweet_id, models.Like.user_id == current_user_id)
+        .returning(models.Like.tweet_id)
+        .cte("removed_like")
     )
+    counted = (await db.execute(_adjust_like_count(removed_like, -1))).first()
 
-    if not like:
+    if counted is None:
         logger.warning(
             f"Like deletion failed: Like not found for user {current_user_id} on tweet {tweet_id}"
         )
         raise LikeNotFound
 
-    db.delete(like)
-    db.commit()
-    like_count = (
-        db.query(func.count(models.Like.id))
-        .filter(models.Like.tweet_id == models.Like.tweet_id)
-        .scalar()
-    )
-    logger.info(f"User {current_user_id} successfully unliked tweet {tweet_id}")
+    await db.commit()
+    logger.info("User %s successfully unliked tweet %s", current_user_id, tweet_id)
     return {
-        "like_count": like_count,
+        "like_count": counted.like_count,
     }
+
+
+async def _stage_likes(pairs: list[tuple[uuid.UUID, uuid.UUID]], db: AsyncSession):
+    """COPY `pairs` into a temporary table that is dropped on commit."""
+    await db.execute(
+        text(
+            "CREATE TEMPORARY TABLE staged_likes (tweet_id uuid, user_id uuid) "
+            "ON COMMIT DROP"
+        )
+    )
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        "staged_likes", records=pairs, columns=["tweet_id", "user_id"]
+    )
+    return table("staged_likes", column("tweet_id"), column("user_id"))
+
+
+async def bulk_create_likes(
+    pairs: list[tuple[uuid.UUID, uuid.UUID]], db: AsyncSession
+) -> int:
+    """Insert (tweet_id, user_id) likes in bulk for imports and backfills.
+
+    Likes that already exist, or that name a missing tweet or user, are
+    skipped. Each affected tweet's like_count is raised by the number of
+    likes it gained, in the same statement, and cached home feed pages are
+    invalidated so they show the new counts. Returns the number of likes
+    inserted.
+    """
+    if not pairs:
+        return 0
+
+    if len(pairs) > _COPY_THRESHOLD:
+        source = await _stage_likes(pairs, db)
+    else:
+        source = values(
+            column("tweet_id", UUID(as_uuid=True)),
+            column("user_id", UUID(as_uuid=True)),
+            name="pairs",
+        ).data(pairs)
+
+    new_likes = (
+        insert(models.Like)
+        .from_select(
+            ["tweet_id", "user_id"],
+            select(source.c.tweet_id, source.c.user_id)
+            .join(models.Tweet, models.Tweet.id == source.c.tweet_id)
+            .join(models.User, models.User.id == source.c.user_id),
+        )
+        .on_conflict_do_nothing()
+        .returning(models.Like.tweet_id)
+        .cte("new_likes")
+    )
+    gained = (
+        select(new_likes.c.tweet_id, func.count().label("likes"))
+        .group_by(new_likes.c.tweet_id)
+        .cte("gained")
+    )
+    counted = _adjust_like_count(gained, gained.c.likes).cte("counted")
+    inserted = await db.scalar(
+        select(func.count()).select_from(new_likes).add_cte(counted)
+    )
+    await db.commit()
+    if inserted:
+        await invalidate_home_feed()
+
+    logger.info("Bulk imported %s of %s likes", inserted, len(pairs))
+    return inserted
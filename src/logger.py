@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 if not os.path.exists("logs"):
     os.makedirs("logs")
@@ -13,10 +15,18 @@ file_handler.setFormatter(log_formatter)
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(log_formatter)
 
+# Request code only enqueues records; a background thread does the file and
+# console writes, including rotation, off the event loop.
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logger = logging.getLogger("twitter_demake_logger")
 logger.setLevel(logging.DEBUG)
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+logger.addHandler(QueueHandler(log_queue))
 
 
 def get_logger():
@@ -1,30 +1,46 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.auth.routers import router as auth_router
-from src.database import engine
+from src.config import settings
+from src.database import engine, pool_stats, warm_pool
 from src.follow.routers import router as follow_router
 from src.like.routers import router as likes_router
-from src.models import Base
 from src.retweet.routers import router as retweets_router
 from src.tweets.routers import router as tweets_router
 from src.users.routers import router as users_router
 
-app = FastAPI()
+
+# The schema is managed by Alembic (`alembic upgrade head`) at deploy time,
+# not created on every worker start.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_pool()
+    yield
+    await engine.dispose()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-origins = ["*"]
+origins = [origin.strip() for origin in settings.cors_origins.split(",")]
 
+# Credentialed requests need a concrete origin list; with the "*" default only
+# the bearer-token API is open to every origin. The home feed's next-page
+# cursor travels in a response header, which browsers hide unless exposed.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
-    allow_credentials=True,
+    allow_credentials=origins != ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
-Base.metadata.create_all(bind=engine)
 
 app.include_router(users_router)
 app.include_router(auth_router)
@@ -32,3 +48,8 @@ app.include_router(tweets_router)
 app.include_router(follow_router)
 app.include_router(likes_router)
 app.include_router(retweets_router)
+
+
+@app.get("/healthz", tags=["health"])
+async def healthz():
+    return {"status": "ok", "pool": pool_stats()}
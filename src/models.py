@@ -1,11 +1,9 @@
-import uuid
-
 from sqlalchemy import (
-    Boolean,
     Column,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -21,7 +19,15 @@ from src.database import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4)
+    # Primary keys are generated by PostgreSQL (gen_random_uuid() is built in
+    # from version 13) and read back through RETURNING, so ORM, Core and bulk
+    # inserts all get ids without round-tripping them through Python.
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+        index=True,
+    )
     full_name = Column(String(100), nullable=False)
     username = Column(String(50), unique=True, nullable=False)
     email = Column(String(255), unique=True, nullable=False)
@@ -35,29 +41,42 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     verified_on = Column(DateTime(timezone=True), nullable=True)
 
-    tweets = relationship("Tweet", back_populates="user", cascade="all, delete-orphan")
+    # Collections raise on lazy access: queries that need one must eager-load
+    # it, instead of issuing a SELECT per parent row.
+    tweets = relationship(
+        "Tweet", back_populates="user", cascade="all, delete-orphan", lazy="raise"
+    )
     retweets = relationship(
-        "Retweet", back_populates="user", cascade="all, delete-orphan"
+        "Retweet", back_populates="user", cascade="all, delete-orphan", lazy="raise"
+    )
+    likes = relationship(
+        "Like", back_populates="user", cascade="all, delete-orphan", lazy="raise"
     )
-    likes = relationship("Like", back_populates="user", cascade="all, delete-orphan")
     following = relationship(
         "Follow",
         backref="follower",
         foreign_keys="[Follow.follower_id]",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
     followers = relationship(
         "Follow",
         backref="followed",
         foreign_keys="[Follow.followed_id]",
         cascade="all, delete-orphan",
+        lazy="raise",
     )
 
 
 class Tweet(Base):
     __tablename__ = "tweets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+        index=True,
+    )
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     content = Column(Text, nullable=True)
     media_url = Column(String, nullable=True)
@@ -67,24 +86,53 @@ class Tweet(Base):
         nullable=True,
     )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Maintained by the like, retweet and tweet write statements, so reads
+    # need no COUNT over the likes/retweets tables or the replies.
+    like_count = Column(Integer, nullable=False, server_default="0")
+    retweet_count = Column(Integer, nullable=False, server_default="0")
+    reply_count = Column(Integer, nullable=False, server_default="0")
+    # "pending_tone" while a requested tone rewrite runs in the background.
+    status = Column(String, nullable=False, server_default="ready")
     user = relationship("User", back_populates="tweets")
     replies = relationship(
         "Tweet",
         backref=backref("parent_tweet", remote_side=[id], passive_deletes=True),
         cascade="all, delete-orphan",
         passive_deletes=True,
+        lazy="raise",
     )
 
     retweets = relationship(
-        "Retweet", back_populates="tweet", cascade="all, delete-orphan"
+        "Retweet", back_populates="tweet", cascade="all, delete-orphan", lazy="raise"
+    )
+    likes = relationship(
+        "Like", back_populates="tweet", cascade="all, delete-orphan", lazy="raise"
+    )
+
+    __table_args__ = (
+        # Backs keyset pagination of replies by (created_at, id).
+        Index("ix_tweets_parent_created_id", "parent_tweet_id", "created_at", "id"),
+        # Profile timelines and reply lists, newest first.
+        Index("ix_tweets_user_created_id", "user_id", "created_at", "id"),
+        # The home feed only lists top-level tweets, paged by (created_at, id).
+        Index(
+            "ix_tweets_root_created_id",
+            "created_at",
+            "id",
+            postgresql_where=parent_tweet_id.is_(None),
+        ),
     )
-    likes = relationship("Like", back_populates="tweet", cascade="all, delete-orphan")
 
 
 class Retweet(Base):
     __tablename__ = "retweets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+        index=True,
+    )
     tweet_id = Column(
         UUID(as_uuid=True), ForeignKey("tweets.id", ondelete="CASCADE"), nullable=False
     )
@@ -97,13 +145,22 @@ class Retweet(Base):
 
     __table_args__ = (
         UniqueConstraint("tweet_id", "user_id", name="uq_retweet_tweet_user"),
+        # The unique constraint serves per-tweet lookups; this index serves
+        # per-user ones, including the users ON DELETE CASCADE. Profile
+        # timelines seek on (created_at, tweet_id), newest first.
+        Index("ix_retweets_user_created_tweet", "user_id", "created_at", "tweet_id"),
     )
 
 
 class Like(Base):
     __tablename__ = "likes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+        index=True,
+    )
     tweet_id = Column(
         UUID(as_uuid=True), ForeignKey("tweets.id", ondelete="CASCADE"), nullable=False
     )
@@ -116,6 +173,7 @@ class Like(Base):
 
     __table_args__ = (
         UniqueConstraint("tweet_id", "user_id", name="uq_like_tweet_user"),
+        Index("ix_likes_user_tweet", "user_id", "tweet_id"),
     )
 
 
@@ -124,7 +182,30 @@ class Follow(Base):
 
     follower_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
     followed_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Not nullable: follow lists seek on (created_at, user id), and a row
+    # value comparison never pages past a NULL timestamp.
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    # The primary key serves lookups by follower; this serves "who follows X".
+    # The created_at indexes back keyset paging of each user's follower and
+    # following lists, newest first.
+    __table_args__ = (
+        Index("ix_follows_followed_follower", "followed_id", "follower_id"),
+        Index(
+            "ix_follows_followed_created_follower",
+            "followed_id",
+            "created_at",
+            "follower_id",
+        ),
+        Index(
+            "ix_follows_follower_created_followed",
+            "follower_id",
+            "created_at",
+            "followed_id",
+        ),
+    )
 
     # follower = relationship(
     #     "User", foreign_keys=[follower_id], back_populates="following"
@@ -1,11 +1,10 @@
 import uuid
 
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src import models
 from src.database import get_db
-from src.dependencies import get_current_user
+from src.dependencies import CurrentUser, get_current_user
 from src.retweet import schemas, service
 
 router = APIRouter(prefix="/retweets", tags=["Retweets"])
@@ -18,8 +17,8 @@ router = APIRouter(prefix="/retweets", tags=["Retweets"])
 )
 async def create_retweet(
     retweet: schemas.RetweetCreate,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Create a retweet of an existing tweet.
 
@@ -27,8 +26,8 @@ async def create_retweet(
 
     Args:
         retweet (schemas.RetweetCreate): Contains the ID of the tweet to retweet.
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user creating the retweet.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user creating the retweet.
 
     Returns:
         RetweetResponse: Details of the created retweet.
@@ -64,8 +63,8 @@ async def create_retweet(
 @router.delete("/{tweet_id}", status_code=status.HTTP_200_OK)
 async def delete_retweet(
     tweet_id: uuid.UUID,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Remove a retweet from user's timeline.
 
@@ -74,8 +73,8 @@ async def delete_retweet(
 
     Args:
         tweet_id (uuid.UUID): ID of the original tweet that was retweeted.
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user deleting the retweet.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user deleting the retweet.
 
     Returns:
         dict: Success message.
@@ -1,55 +1,100 @@
 import uuid
 
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from src import models
+from src import models, utils
 from src.logger import get_logger
+from src.retweet import schemas
 from src.retweet.exceptions import AlreadyRetweeted, RetweetNotFound, TweetNotFound
 
 logger = get_logger()
 
 
-async def create_retweet(tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: Session):
-    tweet = db.query(models.Tweet).filter(models.Tweet.id == tweet_id).first()
-    if not tweet:
+def _adjust_retweet_count(changed_retweet, delta: int):
+    """Update the retweet_count of the tweet named by the `changed_retweet` CTE.
+
+    Like the like counter, the UPDATE only matches when the CTE produced a
+    row, and its row lock keeps concurrent retweets from losing updates.
+    """
+    return (
+        update(models.Tweet)
+        .where(models.Tweet.id == changed_retweet.c.tweet_id)
+        .values(retweet_count=models.Tweet.retweet_count + delta)
+        # The UPDATE's FROM names a CTE, which the ORM cannot evaluate to sync
+        # loaded objects; none are loaded here anyway.
+        .execution_options(synchronize_session=False)
+        .returning(models.Tweet.id)
+    )
+
+
+async def create_retweet(
+    tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
+    # One round trip: a duplicate retweet inserts nothing and returns no row,
+    # and a missing tweet fails the foreign key. The id comes from the column's
+    # server default.
+    new_retweet = (
+        insert(models.Retweet)
+        .values(tweet_id=tweet_id, user_id=current_user_id)
+        .on_conflict_do_nothing()
+        .returning(*models.Retweet.__table__.c)
+        .cte("new_retweet")
+    )
+    counted = _adjust_retweet_count(new_retweet, 1).cte("counted")
+    try:
+        db_retweet = await db.scalar(
+            select(aliased(models.Retweet, new_retweet)).add_cte(counted)
+        )
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if not utils.is_foreign_key_violation(e):
+            raise
         logger.warning(f"Retweet failed: Tweet {tweet_id} not found")
         raise TweetNotFound
 
-    try:
-        db_retweet = models.Retweet(tweet_id=tweet_id, user_id=current_user_id)
-        db.add(db_retweet)
-        db.commit()
-        db.refresh(db_retweet)
-        logger.info(f"User {current_user_id} successfully retweeted tweet {tweet_id}")
-        return db_retweet
-    except IntegrityError:
-        db.rollback()
+    if db_retweet is None:
         logger.warning(
             f"Retweet failed: User {current_user_id} already retweeted tweet {tweet_id}"
         )
         raise AlreadyRetweeted
 
+    logger.info("User %s successfully retweeted tweet %s", current_user_id, tweet_id)
+    # The row comes from typed columns, so the response skips validation.
+    return schemas.RetweetResponse.model_construct(
+        id=db_retweet.id,
+        tweet_id=db_retweet.tweet_id,
+        user_id=db_retweet.user_id,
+        created_at=db_retweet.created_at,
+    )
+
 
-async def delete_retweet(tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: Session):
-    retweet = (
-        db.query(models.Retweet)
-        .filter(
+async def delete_retweet(
+    tweet_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
+    removed_retweet = (
+        delete(models.Retweet)
+        .where(
             models.Retweet.tweet_id == tweet_id,
             models.Retweet.user_id == current_user_id,
         )
-        .first()
+        .returning(models.Retweet.tweet_id)
+        .cte("removed_retweet")
     )
+    counted_tweet_id = await db.scalar(_adjust_retweet_count(removed_retweet, -1))
 
-    if not retweet:
+    if counted_tweet_id is None:
         logger.warning(
             f"Retweet deletion failed: Retweet not found for user {current_user_id} on tweet {tweet_id}"
         )
         raise RetweetNotFound
 
-    db.delete(retweet)
-    db.commit()
+    await db.commit()
     logger.info(
-        f"User {current_user_id} successfully deleted retweet on tweet {tweet_id}"
+        "User %s successfully deleted retweet on tweet %s", current_user_id, tweet_id
     )
     return {"message": "Retweet deleted successfully."}
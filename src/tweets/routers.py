@@ -1,45 +1,85 @@
 import uuid
+from collections import namedtuple
 from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src import models
 from src.database import get_db
-from src.dependencies import get_current_user
+from src.dependencies import CurrentUser, get_current_user
 from src.tweets import schemas, service
 from src.tweets.exceptions import (
     EmptyTweetException,
     EmptyTweetToneRequestError,
     TweetOverflowException,
 )
+from src.tweets.utils import MAX_TWEET_LENGTH
 
 router = APIRouter(prefix="/tweets", tags=["tweets"])
 
+TweetForm = namedtuple("TweetForm", "content tone parent_tweet_id media")
 
-@router.post(
-    "", status_code=status.HTTP_201_CREATED, response_model=schemas.TweetCreateResponse
-)
-async def create_tweet(
+
+# Declared ahead of get_current_user in create_tweet, so FastAPI runs these
+# checks first and an empty or oversized tweet is rejected without touching
+# the database.
+async def validate_tweet_form(
     content: Annotated[Optional[str], Form(description="Content of the tweet")] = None,
     tone: Annotated[Optional[str], Form()] = None,
     parent_tweet_id: Annotated[Optional[uuid.UUID], Form()] = None,
     media: Annotated[Optional[UploadFile], File()] = None,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+) -> TweetForm:
+    # The length check needs no copy; isspace() then tests for blank content
+    # in one pass without building the stripped string.
+    if content and len(content) > MAX_TWEET_LENGTH:
+        raise TweetOverflowException
+    if not content or content.isspace():
+        if tone:
+            raise EmptyTweetToneRequestError
+        if media == None:
+            raise EmptyTweetException
+    return TweetForm(content, tone, parent_tweet_id, media)
+
+
+@router.post(
+    "", status_code=status.HTTP_201_CREATED, response_model=schemas.TweetCreateResponse
+)
+async def create_tweet(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    form: TweetForm = Depends(validate_tweet_form),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new tweet or reply.
 
     Creates a new tweet, optionally with media attachment or as a reply to another tweet.
     The tone parameter can be used to modify the writing style of the tweet.
+    The rewrite runs in the background: the tweet is stored as written with
+    status "pending_tone", the response is 202, and GET /tweets/{id} shows
+    the rewritten content once status is "ready".
 
     Args:
-        content (str, optional): The main text content of the tweet.
-        tone (str, optional): Desired writing style for the tweet content.
-        parent_tweet_id (uuid.UUID, optional): ID of the tweet being replied to.
-        media (UploadFile, optional): Media file to attach to the tweet.
-        current_user (models.User): The authenticated user creating the tweet.
-        db (Session): Database session instance.
+        response (Response): Used to answer 202 when a tone rewrite is pending.
+        background_tasks (BackgroundTasks): Runs the tone rewrite after the
+            response is sent.
+        form (TweetForm): The validated form fields:
+            content (str, optional): The main text content of the tweet.
+            tone (str, optional): Desired writing style for the tweet content.
+            parent_tweet_id (uuid.UUID, optional): ID of the tweet being replied to.
+            media (UploadFile, optional): Media file to attach to the tweet.
+        current_user (CurrentUser): The authenticated user creating the tweet.
+        db (AsyncSession): Database session instance.
 
     Returns:
         TweetCreateResponse: Created tweet details with success message.
@@ -53,7 +93,8 @@ async def create_tweet(
                         "media_url": "http://example.com/media/image.jpg",
                         "user_id": "789e4567-e89b-12d3-a456-426614174000",
                         "created_at": "2024-03-15T14:30:00Z",
-                        "parent_tweet_id": null
+                        "parent_tweet_id": null,
+                        "status": "ready"
                     }
                 }
 
@@ -71,25 +112,25 @@ async def create_tweet(
         - Either content or media must be provided
         - This endpoint requires authentication
     """
-
-    if not content or content.strip() == "":
-        if tone:
-            raise EmptyTweetToneRequestError
-        if media == None:
-            raise EmptyTweetException
-    elif len(content) > 280:
-        raise TweetOverflowException
     tweet = await service.create_new_tweet(
-        current_user.id, content, tone, parent_tweet_id, media, db
+        current_user.id,
+        form.content,
+        form.tone,
+        form.parent_tweet_id,
+        form.media,
+        db,
+        background_tasks,
     )
+    if form.tone:
+        response.status_code = status.HTTP_202_ACCEPTED
     return {"message": "Tweet Created Successfully", "data": tweet}
 
 
 @router.delete("/{tweet_id}", status_code=status.HTTP_200_OK)
 async def delete_tweet(
     tweet_id: uuid.UUID,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """Delete a tweet.
 
@@ -97,8 +138,8 @@ async def delete_tweet(
 
     Args:
         tweet_id (uuid.UUID): ID of the tweet to delete.
-        current_user (models.User): The authenticated user making the request.
-        db (Session): Database session instance.
+        current_user (CurrentUser): The authenticated user making the request.
+        db (AsyncSession): Database session instance.
 
     Returns:
         dict: Success message.
@@ -125,11 +166,13 @@ async def delete_tweet(
 
 @router.get("/home", response_model=List[schemas.TweetHomePageResponse])
 async def get_home_page_tweets(
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
     tab: str = Query("all", enum=["all", "following"]),
     skip: int = Query(0, ge=0),
     limit: int = Query(5, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
 ):
     """Get tweets for home feed.
 
@@ -137,11 +180,14 @@ async def get_home_page_tweets(
     Can filter between all tweets or just tweets from followed users.
 
     Args:
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user viewing the feed.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user viewing the feed.
         tab (str): Feed filter - "all" or "following". Defaults to "all".
         skip (int): Number of tweets to skip for pagination. Defaults to 0.
+            Ignored when a cursor is given.
         limit (int): Maximum tweets to return. Range: 1-100. Defaults to 5.
+        cursor (str, optional): The `X-Next-Cursor` header of the previous
+            page; the page continues right after it.
 
     Returns:
         List[TweetHomePageResponse]: List of tweets with user and engagement details.
@@ -167,25 +213,34 @@ async def get_home_page_tweets(
                 ]
 
     Raises:
-        HTTPException: 500 for internal server errors
+        HTTPException:
+            - 400: Malformed cursor
+            - 500: Internal server errors
 
     Note:
         - Tweets are ordered by creation date (newest first)
+        - The `X-Next-Cursor` response header is set while more tweets remain
         - "following" tab shows only tweets from users you follow
         - Retweets are included in the feed
         - This endpoint requires authentication
     """
 
-    return await service.get_home_page_tweets(tab, skip, limit, current_user.id, db)
+    tweets, next_cursor = await service.get_home_page_tweets(
+        tab, skip, limit, current_user.id, db, cursor=cursor
+    )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return tweets
 
 
 @router.get("/{tweet_id}", response_model=schemas.TweetDetail)
 async def get_tweet(
     tweet_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     reply_skip: int = Query(0, ge=0),
+    reply_cursor: Optional[str] = Query(None),
     reply_limit: int = Query(5, ge=1, le=100),
-    current_user=Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Get detailed tweet information.
 
@@ -194,10 +249,13 @@ async def get_tweet(
 
     Args:
         tweet_id (uuid.UUID): ID of the tweet to retrieve.
-        db (Session): Database session instance.
-        reply_skip (int): Number of replies to skip. Defaults to 0.
+        db (AsyncSession): Database session instance.
+        reply_skip (int): Number of replies to skip. Defaults to 0. Ignored
+            when a reply cursor is given.
+        reply_cursor (str, optional): Opaque cursor from a previous response's
+            `next_reply_cursor`. Omit to start from the newest reply.
         reply_limit (int): Maximum replies to return. Range: 1-100. Defaults to 5.
-        current_user (models.User): The authenticated user making the request.
+        current_user (CurrentUser): The authenticated user making the request.
 
     Returns:
         TweetDetail: Detailed tweet information including replies.
@@ -208,6 +266,7 @@ async def get_tweet(
                     "content": "Original tweet",
                     "media_url": "http://example.com/media/image.jpg",
                     "created_at": "2024-03-15T14:30:00Z",
+                    "status": "ready",
                     "user": {
                         "id": "789e4567-e89b-12d3-a456-426614174000",
                         "username": "john_wick",
@@ -216,30 +275,26 @@ async def get_tweet(
                     },
                     "like_count": 42,
                     "retweet_count": 7,
-                    "replies": [
-                        {
-                            "id": "456e4567-e89b-12d3-a456-426614174000",
-                            "content": "Reply tweet",
-                            "created_at": "2024-03-15T15:00:00Z",
-                            "user": {
-                                "username": "jane_wick",
-                                "full_name": "Jane Wick"
-                            }
-                        }
-                    ]
+                    "reply_ids": ["456e4567-e89b-12d3-a456-426614174000"],
+                    "next_reply_cursor": "MjAyNC0wMy0xNVQxNTowMDowMCswMDowMHw0NTZl..."
                 }
 
     Raises:
-        HTTPException: 404 if tweet not found
+        HTTPException:
+            - 400: Malformed reply cursor
+            - 404: Tweet not found
 
     Note:
         - Replies are ordered by creation date (newest first)
+        - `next_reply_cursor` is null once the last page of replies is reached
         - Includes engagement metrics (likes, retweets, replies)
         - Media URLs are included if present
         - This endpoint requires authentication
     """
 
-    return await service.get_tweet_details(tweet_id, reply_skip, reply_limit, db)
+    return await service.get_tweet_details(
+        tweet_id, reply_skip, reply_limit, db, reply_cursor=reply_cursor
+    )
 
 
 @router.get(
@@ -254,8 +309,9 @@ async def get_user_tweets(
     user_id: Optional[uuid.UUID],
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> schemas.UserTweetsResponse:
     """Get user's tweets.
 
@@ -265,10 +321,13 @@ async def get_user_tweets(
     Args:
         user_id (uuid.UUID, optional): ID of user whose tweets to retrieve.
             If None, uses authenticated user's ID.
-        skip (int): Number of tweets to skip. Defaults to 0.
+        skip (int): Number of tweets to skip. Defaults to 0. Ignored when a
+            cursor is given.
         limit (int): Maximum tweets to return. Defaults to 20.
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user making the request.
+        cursor (str, optional): `next_cursor` from the previous page; the
+            page continues right after it.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user making the request.
 
     Returns:
         UserTweetsResponse: List of user's tweets with engagement metrics.
@@ -290,14 +349,18 @@ async def get_user_tweets(
                             "retweets_count": 7,
                             "replies_count": 3
                         }
-                    ]
+                    ],
+                    "next_cursor": "MjAyNC0wMy0xNVQxNDozMDowMCswMDowMHwxMjNl..."
                 }
 
     Raises:
-        HTTPException: 404 if specified user not found
+        HTTPException:
+            - 400: Malformed cursor
+            - 404: Specified user not found
 
     Note:
         - Tweets are ordered by creation date (newest first)
+        - `next_cursor` is null once the last page is reached
         - Replies are not included in this endpoint
         - Retweets are included
         - This endpoint requires authentication
@@ -305,7 +368,7 @@ async def get_user_tweets(
 
     if not user_id:
         user_id = current_user.id
-    return await service.get_user_tweets(user_id, skip, limit, db)
+    return await service.get_user_tweets(user_id, skip, limit, db, cursor=cursor)
 
 
 @router.get(
@@ -320,8 +383,9 @@ async def get_user_replies(
     user_id: Optional[uuid.UUID],
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> schemas.UserRepliesResponse:
     """Get user's replies.
 
@@ -331,10 +395,13 @@ async def get_user_replies(
     Args:
         user_id (uuid.UUID, optional): ID of user whose replies to retrieve.
             If None, uses authenticated user's ID.
-        skip (int): Number of replies to skip. Defaults to 0.
+        skip (int): Number of replies to skip. Defaults to 0. Ignored when a
+            cursor is given.
         limit (int): Maximum replies to return. Defaults to 20.
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user making the request.
+        cursor (str, optional): `next_cursor` from the previous page; the
+            page continues right after it.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user making the request.
 
     Returns:
         UserRepliesResponse: List of user's replies with parent tweet details.
@@ -363,14 +430,18 @@ async def get_user_replies(
                                 }
                             }
                         }
-                    ]
+                    ],
+                    "next_cursor": null
                 }
 
     Raises:
-        HTTPException: 404 if specified user not found
+        HTTPException:
+            - 400: Malformed cursor
+            - 404: Specified user not found
 
     Note:
         - Replies are ordered by creation date (newest first)
+        - `next_cursor` is null once the last page is reached
         - Includes only tweets that are replies to other tweets
         - Parent tweet details are included if available
         - This endpoint requires authentication
@@ -378,4 +449,4 @@ async def get_user_replies(
 
     if not user_id:
         user_id = current_user.id
-    return await service.get_user_replies(user_id, skip, limit, db)
+    return await service.get_user_replies(user_id, skip, limit, db, cursor=cursor)
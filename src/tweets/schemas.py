@@ -16,6 +16,7 @@ class Tweet(TweetBase):
     user_id: UUID4
     parent_tweet_id: uuid.UUID | None = None
     created_at: datetime
+    status: str = "ready"
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -42,10 +43,12 @@ class TweetDetail(BaseModel):
     content: str | None = None
     media_url: str | None = None
     created_at: datetime
+    status: str = "ready"
     user: UserInfo
     like_count: int
     retweet_count: int
     reply_ids: List[UUID4]
+    next_reply_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -106,6 +109,7 @@ class TweetResponse(UserTweetBase):
 
 class UserTweetsResponse(BaseModel):
     tweets: List[TweetResponse | RetweetInfo]
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -116,5 +120,6 @@ class ReplyTweet(UserTweetBase):
 
 class UserRepliesResponse(BaseModel):
     replies: List[ReplyTweet]
+    next_cursor: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -1,19 +1,62 @@
 import os
 import uuid
-
-from fastapi import UploadFile
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
-
-from src import models
+from typing import List, Optional, Tuple
+
+from cachetools import TTLCache
+from fastapi import BackgroundTasks, UploadFile
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    delete,
+    exists,
+    false,
+    insert,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
+from starlette.concurrency import run_in_threadpool
+
+from src import cache, models, utils
+from src.database import SessionLocal
 from src.logger import get_logger
 from src.tweets import schemas
 from src.tweets.exceptions import InvaildParentTweet, MediaUploadError, TweetNotFound
-from src.tweets.utils import save_tweet_media
+from src.tweets.utils import MAX_TWEET_LENGTH, save_tweet_media
 from src.users.exceptions import UserNotFound
 
 logger = get_logger()
 
+# Home feed pages are cached for a short TTL. Creating or deleting any tweet
+# bumps the shared "all" generation, and following or unfollowing bumps the
+# viewer's own, so either change shows up at once; like and retweet counts
+# may lag by up to the TTL.
+HOME_CACHE_NAMESPACE = "home"
+_HOME_CACHE_TTL = 15
+_ALL_TWEETS = "all"
+_home_page_adapter = TypeAdapter(
+    Tuple[List[schemas.TweetHomePageResponse], Optional[str]]
+)
+
+# The "all" home feed is the same for every viewer, so its pages are also
+# kept briefly in-process, in front of Redis. Entries are keyed by a version
+# that tweet writes bump, so a page computed before a write is stored under
+# a key nobody reads any more; other workers catch up within the TTL.
+_HOME_FEED_TTL = 3
+_home_feed_cache = TTLCache(maxsize=1024, ttl=_HOME_FEED_TTL)
+_home_feed_version = 0
+
+
+async def invalidate_home_feed():
+    """Make every cached home feed page, in-process and in Redis, unreachable."""
+    global _home_feed_version
+    _home_feed_version += 1
+    await cache.bump_generations(HOME_CACHE_NAMESPACE, _ALL_TWEETS)
+
 
 async def create_new_tweet(
     current_user_id: uuid.UUID,
@@ -21,13 +64,16 @@ async def create_new_tweet(
     tone: str,
     parent_tweet_id: uuid.UUID,
     media: UploadFile,
-    db: Session,
+    db: AsyncSession,
+    background_tasks: BackgroundTasks,
 ):
     if parent_tweet_id:
-        parent_tweet = (
-            db.query(models.Tweet).filter(models.Tweet.id == parent_tweet_id).first()
+        # Checked before the media upload so a bad parent never leaves an
+        # orphaned file behind.
+        parent_exists = await db.scalar(
+            select(exists().where(models.Tweet.id == parent_tweet_id))
         )
-        if not parent_tweet:
+        if not parent_exists:
             logger.error(f"Invalid parent tweet ID: {parent_tweet_id}")
             raise InvaildParentTweet
     try:
@@ -36,137 +82,298 @@ async def create_new_tweet(
     except Exception as e:
         logger.error(f"Media upload failed for tweet by user {current_user_id}: {e}")
         raise MediaUploadError
-    revised_tweet = None
-    if tone:
-        revised_tweet = await change_tweet_tone(content, tone)
-        logger.debug(f"Revised tweet with tone '{tone}': {revised_tweet}")
-
-        # print(revised_tweet)
-    new_tweet = models.Tweet(
-        user_id=current_user_id,
-        content=revised_tweet if revised_tweet else content,
-        media_url=f"http://localhost:8000/{media_path}" if media_path else None,
-        parent_tweet_id=(parent_tweet_id if parent_tweet_id else None),
-    )
-
-    db.add(new_tweet)
-    db.commit()
-    db.refresh(new_tweet)
+    # The tone rewrite is a model round trip of several seconds, so the tweet
+    # is stored as written and rewritten after the response is sent.
+    # INSERT ... RETURNING hands back the server defaults (created_at) in
+    # the same round trip, so no refresh() is needed.
+    try:
+        new_tweet = (
+            await db.execute(
+                insert(models.Tweet)
+                .values(
+                    user_id=current_user_id,
+                    content=content,
+                    media_url=utils.public_url(media_path) if media_path else None,
+                    parent_tweet_id=(parent_tweet_id if parent_tweet_id else None),
+                    status="pending_tone" if tone else "ready",
+                )
+                .returning(models.Tweet)
+            )
+        ).scalar_one()
+        if parent_tweet_id:
+            await db.execute(
+                update(models.Tweet)
+                .where(models.Tweet.id == parent_tweet_id)
+                .values(reply_count=models.Tweet.reply_count + 1)
+            )
+        await db.commit()
+    except IntegrityError as e:
+        # The parent was deleted between the existence check and the insert.
+        await db.rollback()
+        if media_path:
+            # Don't keep media for a tweet that was never stored.
+            os.remove(media_path)
+        if not utils.is_foreign_key_violation(e):
+            raise
+        logger.error(f"Invalid parent tweet ID: {parent_tweet_id}")
+        raise InvaildParentTweet
+    await invalidate_home_feed()
     logger.info(
         f"New tweet created by user {current_user_id} with tweet ID: {new_tweet.id}"
     )
+    if tone:
+        background_tasks.add_task(apply_tweet_tone, new_tweet.id, content, tone)
     return new_tweet
 
 
+async def apply_tweet_tone(tweet_id: uuid.UUID, content: str, tone: str):
+    """Rewrite a pending tweet in `tone` and mark it ready.
+
+    Runs after the create response is sent, on its own session. If the
+    rewrite fails or comes back too long, the tweet keeps its original
+    content; either way it ends up ready.
+    """
+    values = {"status": "ready"}
+    try:
+        rewrite = await change_tweet_tone(content, tone)
+        logger.debug(f"Revised tweet with tone '{tone}': {rewrite}")
+        if rewrite and len(rewrite) <= MAX_TWEET_LENGTH:
+            values["content"] = rewrite
+        else:
+            logger.warning(f"Discarded tone rewrite for tweet {tweet_id}: {rewrite!r}")
+    except Exception as e:
+        logger.error(f"Tone rewrite failed for tweet {tweet_id}: {e}")
+
+    # Matches nothing if the tweet was deleted in the meantime.
+    pending = update(models.Tweet).where(
+        models.Tweet.id == tweet_id, models.Tweet.status == "pending_tone"
+    )
+    try:
+        async with SessionLocal() as db:
+            await db.execute(pending.values(**values))
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Saving tone rewrite failed for tweet {tweet_id}: {e}")
+        # Clients poll until the tweet is ready, so never leave it pending.
+        try:
+            async with SessionLocal() as db:
+                await db.execute(pending.values(status="ready"))
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Marking tweet {tweet_id} ready failed: {e}")
+    await invalidate_home_feed()
+
+
 async def delete_tweet(tweet_id, current_user_id, db):
-    tweet = (
-        db.query(models.Tweet)
-        .filter(models.Tweet.id == tweet_id, models.Tweet.user_id == current_user_id)
-        .first()
+    # A Core DELETE lets the database's ON DELETE CASCADE remove replies,
+    # likes and retweets; an ORM delete would have to load each collection
+    # first, which AsyncSession cannot do lazily. Deleting a reply lowers its
+    # parent's reply_count in the same statement.
+    deleted = (
+        delete(models.Tweet)
+        .where(models.Tweet.id == tweet_id, models.Tweet.user_id == current_user_id)
+        .returning(models.Tweet.id, models.Tweet.parent_tweet_id)
+        .cte("deleted")
     )
-    if not tweet:
+    uncounted = (
+        update(models.Tweet)
+        .where(models.Tweet.id == deleted.c.parent_tweet_id)
+        .values(reply_count=models.Tweet.reply_count - 1)
+        .execution_options(synchronize_session=False)
+        .cte("uncounted")
+    )
+    deleted_id = await db.scalar(select(deleted.c.id).add_cte(uncounted))
+    if deleted_id is None:
         logger.error(f"Tweet not found for deletion: ID {tweet_id}")
         raise TweetNotFound
-    db.delete(tweet)
-    db.commit()
+    await db.commit()
+    await invalidate_home_feed()
     logger.info(f"Tweet deleted successfully: ID {tweet_id} by user {current_user_id}")
     return {"message": "Tweet deleted successfully!"}
 
 
+# Loader options shared by the tweet read queries, built once at import.
+# Counts are columns on the tweet, so the author is the only relationship
+# loaded; any other raises instead of lazy loading, so a new attribute read
+# cannot slip in an N+1.
+_counted_tweet_options = (joinedload(models.Tweet.user), raiseload("*"))
+
+
+def _seek(query, position, cursor: str | None, skip: int):
+    """Page `query` past `cursor`, or by OFFSET `skip` when there is none.
+
+    `position` is the (created_at, id) pair the query is ordered by, newest
+    first. A cursor seeks straight to the next row through the index
+    instead of scanning and discarding the skipped ones.
+    """
+    if cursor:
+        after_created_at, after_id = utils.decode_cursor(cursor)
+        return query.where(tuple_(*position) < tuple_(after_created_at, after_id))
+    return query.offset(skip)
+
+
+def _trim_page(rows, limit: int, position):
+    """Split the `limit + 1` probe row off `rows`, returning (rows, next_cursor)."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, utils.encode_cursor(*position(rows[-1]))
+
+
 async def get_home_page_tweets(
-    tab: str, skip: int, limit: int, current_user_id: uuid.UUID, db: Session
+    tab: str,
+    skip: int,
+    limit: int,
+    current_user_id: uuid.UUID,
+    db: AsyncSession,
+    cursor: str | None = None,
+):
+    """Return one home feed page as (tweets, next_cursor)."""
+    if tab == "following":
+        return await _cached_home_page(tab, skip, limit, current_user_id, db, cursor)
+
+    # Read the version before querying, so a write that lands mid-query
+    # leaves this page under the old version.
+    key = (_home_feed_version, skip, limit, cursor)
+    page = _home_feed_cache.get(key)
+    if page is None:
+        page = await _cached_home_page(tab, skip, limit, current_user_id, db, cursor)
+        _home_feed_cache[key] = page
+    return page
+
+
+async def _cached_home_page(
+    tab: str,
+    skip: int,
+    limit: int,
+    current_user_id: uuid.UUID,
+    db: AsyncSession,
+    cursor: str | None,
+):
+    page = f"{skip}:{limit}:{cursor}"
+    if tab == "following":
+        key = await cache.versioned_key(
+            f"home:following:{page}",
+            HOME_CACHE_NAMESPACE,
+            _ALL_TWEETS,
+            current_user_id,
+        )
+    else:
+        key = await cache.versioned_key(
+            f"home:all:{page}", HOME_CACHE_NAMESPACE, _ALL_TWEETS
+        )
+    return await cache.get_or_set(
+        key,
+        _HOME_CACHE_TTL,
+        lambda: _query_home_page(tab, skip, limit, current_user_id, db, cursor),
+        _home_page_adapter,
+    )
+
+
+async def _query_home_page(
+    tab: str,
+    skip: int,
+    limit: int,
+    current_user_id: uuid.UUID,
+    db: AsyncSession,
+    cursor: str | None,
 ):
+    # Plain column rows rather than ORM entities: the feed only needs these
+    # fields, and rows skip identity-map bookkeeping. Counts are read from
+    # the tweet's counters, so a page costs one round trip.
     base_query = (
-        db.query(models.Tweet, models.User)
+        select(
+            models.Tweet.id,
+            models.Tweet.content,
+            models.Tweet.media_url,
+            models.Tweet.created_at,
+            models.Tweet.like_count,
+            models.Tweet.retweet_count,
+            models.Tweet.reply_count.label("comment_count"),
+            models.User.id.label("user_id"),
+            models.User.username,
+            models.User.full_name,
+            models.User.profile_image_url,
+            models.User.verified_on,
+        )
         .join(models.User, models.Tweet.user_id == models.User.id)
-        .filter(models.Tweet.parent_tweet_id == None)
-        .order_by(models.Tweet.created_at.desc())
+        .where(models.Tweet.parent_tweet_id == None)
+        .order_by(models.Tweet.created_at.desc(), models.Tweet.id.desc())
     )
 
     if tab == "following":
-        following_subquery = (
-            db.query(models.Follow.followed_id)
-            .filter(models.Follow.follower_id == current_user_id)
-            .subquery()
+        following_subquery = select(models.Follow.followed_id).where(
+            models.Follow.follower_id == current_user_id
         )
-        base_query = base_query.filter(models.Tweet.user_id.in_(following_subquery))
+        base_query = base_query.where(models.Tweet.user_id.in_(following_subquery))
 
-    tweets_with_users = base_query.offset(skip).limit(limit).all()
+    position = (models.Tweet.created_at, models.Tweet.id)
+    base_query = _seek(base_query, position, cursor, skip)
+    rows = (await db.execute(base_query.limit(limit + 1))).all()
+    rows, next_cursor = _trim_page(rows, limit, lambda row: (row.created_at, row.id))
 
     result = []
-    for tweet, user in tweets_with_users:
-        like_count = (
-            db.query(func.count(models.Like.id))
-            .filter(models.Like.tweet_id == tweet.id)
-            .scalar()
-        )
-        retweet_count = (
-            db.query(func.count(models.Retweet.id))
-            .filter(models.Retweet.tweet_id == tweet.id)
-            .scalar()
-        )
-        comment_count = (
-            db.query(func.count(models.Tweet.id))
-            .filter(models.Tweet.parent_tweet_id == tweet.id)
-            .scalar()
-        )
-
+    for row in rows:
+        # Every field comes straight from typed columns, so model_construct is
+        # safe; the route's response_model then serializes these instances
+        # without validating them a second time.
         result.append(
-            schemas.TweetHomePageResponse(
-                id=tweet.id,
-                content=tweet.content,
-                media_url=tweet.media_url,
+            schemas.TweetHomePageResponse.model_construct(
+                id=row.id,
+                content=row.content,
+                media_url=row.media_url,
                 media_type=(
                     None
-                    if not tweet.media_url
-                    else os.path.splitext(tweet.media_url)[-1].replace(".", "")
+                    if not row.media_url
+                    else os.path.splitext(row.media_url)[-1].replace(".", "")
                 ),
-                created_at=tweet.created_at,
-                user=schemas.UserInfo(
-                    id=user.id,
-                    username=user.username,
-                    full_name=user.full_name,
-                    profile_image_url=user.profile_image_url,
-                    verified_on=user.verified_on,
+                created_at=row.created_at,
+                user=schemas.UserInfo.model_construct(
+                    id=row.user_id,
+                    username=row.username,
+                    full_name=row.full_name,
+                    profile_image_url=row.profile_image_url,
+                    verified_on=row.verified_on,
                 ),
-                like_count=like_count,
-                retweet_count=retweet_count,
-                comment_count=comment_count,
+                like_count=row.like_count,
+                retweet_count=row.retweet_count,
+                comment_count=row.comment_count,
             )
         )
-    return result
+    return result, next_cursor
 
 
 async def get_tweet_details(
-    tweet_id: uuid.UUID, reply_skip: int, reply_limit: int, db: Session
+    tweet_id: uuid.UUID,
+    reply_skip: int,
+    reply_limit: int,
+    db: AsyncSession,
+    reply_cursor: str | None = None,
 ):
-    tweet_query = (
-        db.query(
-            models.Tweet,
-            models.User,
-            func.count(models.Like.id).label("like_count"),
-            func.count(models.Retweet.id).label("retweet_count"),
-        )
-        .join(models.User, models.Tweet.user_id == models.User.id)
-        .outerjoin(models.Like, models.Tweet.id == models.Like.tweet_id)
-        .outerjoin(models.Retweet, models.Tweet.id == models.Retweet.tweet_id)
-        .filter(models.Tweet.id == tweet_id)
-        .group_by(models.Tweet.id, models.User.id)
+    # Like and retweet counts are the tweet's own counters. Counting both
+    # child tables through outer joins in one GROUP BY multiplied them.
+    tweet = await db.scalar(
+        select(models.Tweet)
+        .where(models.Tweet.id == tweet_id)
+        .options(joinedload(models.Tweet.user), raiseload("*"))
     )
-
-    result = tweet_query.first()
-    if not result:
+    if not tweet:
         raise TweetNotFound
-
-    tweet, user, like_count, retweet_count = result
-
-    reply_ids = (
-        db.query(models.Tweet.id)
-        .filter(models.Tweet.parent_tweet_id == tweet_id)
-        .order_by(models.Tweet.created_at.desc())
-        .offset(reply_skip)
-        .limit(reply_limit)
-        .all()
+    user = tweet.user
+
+    # Keyset pagination: seek past the last (created_at, id) the client saw
+    # instead of scanning and discarding OFFSET rows. reply_skip remains the
+    # fallback when no cursor is given, for existing clients.
+    replies_query = (
+        select(models.Tweet.id, models.Tweet.created_at)
+        .where(models.Tweet.parent_tweet_id == tweet_id)
+        .order_by(models.Tweet.created_at.desc(), models.Tweet.id.desc())
+    )
+    position = (models.Tweet.created_at, models.Tweet.id)
+    replies_query = _seek(replies_query, position, reply_cursor, reply_skip)
+    replies = (await db.execute(replies_query.limit(reply_limit + 1))).all()
+    replies, next_reply_cursor = _trim_page(
+        replies, reply_limit, lambda reply: (reply.created_at, reply.id)
     )
 
     response = schemas.TweetDetail(
@@ -174,6 +381,7 @@ async def get_tweet_details(
         content=tweet.content,
         media_url=tweet.media_url,
         created_at=tweet.created_at,
+        status=tweet.status,
         user=schemas.UserInfo(
             id=user.id,
             username=user.username,
@@ -181,109 +389,117 @@ async def get_tweet_details(
             profile_image_url=user.profile_image_url,
             verified_on=user.verified_on,
         ),
-        like_count=like_count,
-        retweet_count=retweet_count,
-        reply_ids=[reply_id for (reply_id,) in reply_ids],
+        like_count=tweet.like_count,
+        retweet_count=tweet.retweet_count,
+        reply_ids=[reply.id for reply in replies],
+        next_reply_cursor=next_reply_cursor,
     )
     return response
 
 
-async def get_user_tweets(user_id: uuid.UUID, skip: int, limit: int, db: Session):
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
+async def _ensure_user_exists(user_id: uuid.UUID, db: AsyncSession):
+    """Raise UserNotFound unless `user_id` exists.
+
+    Profile lists only call this for an empty page: a non-empty one already
+    proves the user exists, so the common case skips the lookup.
+    """
+    if not await db.scalar(select(exists().where(models.User.id == user_id))):
         raise UserNotFound
 
-    tweets_query = (
-        db.query(models.Tweet)
-        .filter(models.Tweet.user_id == user_id, models.Tweet.parent_tweet_id.is_(None))
-        .options(
-            joinedload(models.Tweet.user),
-            joinedload(models.Tweet.likes),
-            joinedload(models.Tweet.retweets),
-            joinedload(models.Tweet.replies),
-        )
+
+async def get_user_tweets(
+    user_id: uuid.UUID,
+    skip: int,
+    limit: int,
+    db: AsyncSession,
+    cursor: str | None = None,
+):
+    # Original tweets and retweets are merged, ordered and paged in SQL, so a
+    # page holds the true newest `limit` entries across both.
+    timeline = union_all(
+        select(
+            models.Tweet.id.label("tweet_id"),
+            models.Tweet.created_at.label("listed_at"),
+            false().label("is_retweet"),
+        ).where(
+            models.Tweet.user_id == user_id, models.Tweet.parent_tweet_id.is_(None)
+        ),
+        select(models.Retweet.tweet_id, models.Retweet.created_at, true()).where(
+            models.Retweet.user_id == user_id
+        ),
+    ).subquery("timeline")
+    page = select(timeline).order_by(
+        timeline.c.listed_at.desc(), timeline.c.tweet_id.desc()
+    )
+    position = (timeline.c.listed_at, timeline.c.tweet_id)
+    page = _seek(page, position, cursor, skip).limit(limit + 1).subquery("page")
+
+    entries_query = (
+        select(models.Tweet, page.c.listed_at, page.c.is_retweet)
+        .join(page, page.c.tweet_id == models.Tweet.id)
+        .order_by(page.c.listed_at.desc(), page.c.tweet_id.desc())
+        .options(*_counted_tweet_options)
     )
 
-    # Get user's retweets
-    retweets_query = (
-        db.query(models.Tweet)
-        .join(models.Retweet)
-        .filter(models.Retweet.user_id == user_id)
-        .options(
-            joinedload(models.Tweet.user),
-            joinedload(models.Tweet.likes),
-            joinedload(models.Tweet.retweets),
-            joinedload(models.Tweet.replies),
-        )
+    entries = (await db.execute(entries_query)).all()
+    entries, next_cursor = _trim_page(
+        entries, limit, lambda entry: (entry.listed_at, entry.Tweet.id)
     )
+    if not entries:
+        await _ensure_user_exists(user_id, db)
 
+    owner = None
     combined_results = []
-
-    tweets = tweets_query.offset(skip).limit(limit).all()
-    for tweet in tweets:
-        tweet_response = {
+    for tweet, listed_at, is_retweet in entries:
+        entry = {
             "id": tweet.id,
             "content": tweet.content,
             "media_url": tweet.media_url,
-            "created_at": tweet.created_at,
+            "created_at": listed_at,
             "user": tweet.user,
-            "likes_count": len(tweet.likes),
-            "retweets_count": len(tweet.retweets),
-            "replies_count": len(tweet.replies),
-            "is_retweet": False,
+            "likes_count": tweet.like_count,
+            "retweets_count": tweet.retweet_count,
+            "replies_count": tweet.reply_count,
+            "is_retweet": is_retweet,
         }
-        combined_results.append(tweet_response)
-
-    retweets = retweets_query.offset(skip).limit(limit).all()
-    for tweet in retweets:
-        retweet = (
-            db.query(models.Retweet)
-            .filter(
-                models.Retweet.tweet_id == tweet.id, models.Retweet.user_id == user_id
-            )
-            .first()
-        )
-
-        retweet_response = {
-            "id": tweet.id,
-            "content": tweet.content,
-            "media_url": tweet.media_url,
-            "created_at": retweet.created_at,
-            "user": tweet.user,
-            "retweeted_by": retweet.user,
-            "likes_count": len(tweet.likes),
-            "retweets_count": len(tweet.retweets),
-            "replies_count": len(tweet.replies),
-            "is_retweet": True,
-        }
-        combined_results.append(retweet_response)
-
-    combined_results.sort(key=lambda x: x["created_at"], reverse=True)
-    return {"tweets": combined_results}
-
-
-async def get_user_replies(user_id: uuid.UUID, skip: int, limit: int, db: Session):
-    user = db.query(models.User).filter(models.User.id == user_id).first()
-    if not user:
-        raise UserNotFound
-
-    replies = (
-        db.query(models.Tweet)
-        .filter(
+        if is_retweet:
+            # The retweeter is always the profile owner. When the page also
+            # holds one of their own tweets, db.get finds them in the
+            # identity map without a query.
+            if owner is None:
+                owner = await db.get(models.User, user_id)
+            entry["retweeted_by"] = owner
+        combined_results.append(entry)
+
+    return {"tweets": combined_results, "next_cursor": next_cursor}
+
+
+async def get_user_replies(
+    user_id: uuid.UUID,
+    skip: int,
+    limit: int,
+    db: AsyncSession,
+    cursor: str | None = None,
+):
+    replies_query = (
+        select(models.Tweet)
+        .where(
             models.Tweet.user_id == user_id, models.Tweet.parent_tweet_id.isnot(None)
         )
         .options(
-            joinedload(models.Tweet.user),
+            *_counted_tweet_options,
             joinedload(models.Tweet.parent_tweet).joinedload(models.Tweet.user),
-            joinedload(models.Tweet.likes),
-            joinedload(models.Tweet.retweets),
-            joinedload(models.Tweet.replies),
         )
-        .order_by(models.Tweet.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+        .order_by(models.Tweet.created_at.desc(), models.Tweet.id.desc())
+    )
+    position = (models.Tweet.created_at, models.Tweet.id)
+    replies_query = _seek(replies_query, position, cursor, skip).limit(limit + 1)
+    replies = (await db.execute(replies_query)).scalars().all()
+    replies, next_cursor = _trim_page(
+        replies, limit, lambda reply: (reply.created_at, reply.id)
     )
+    if not replies:
+        await _ensure_user_exists(user_id, db)
 
     replies_response = []
     for reply in replies:
@@ -293,19 +509,21 @@ async def get_user_replies(user_id: uuid.UUID, skip: int, limit: int, db: Sessio
             "media_url": reply.media_url,
             "created_at": reply.created_at,
             "user": reply.user,
-            "likes_count": len(reply.likes),
-            "retweets_count": len(reply.retweets),
-            "replies_count": len(reply.replies),
+            "likes_count": reply.like_count,
+            "retweets_count": reply.retweet_count,
+            "replies_count": reply.reply_count,
             "parent_tweet": reply.parent_tweet,
         }
         replies_response.append(reply_data)
-    return {"replies": replies_response}
+    return {"replies": replies_response, "next_cursor": next_cursor}
 
 
 async def change_tweet_tone(tweet, tone, parent_tweet=None):
     import ollama
 
-    answer = ollama.generate(
+    # ollama.generate blocks, so it runs off the event loop.
+    answer = await run_in_threadpool(
+        ollama.generate,
         model="gemma2",
         prompt=f"Rewrite the following tweet, delimited by triple backticks, in a {tone} tone. Only return the revised tweet text with no additional commentary or explanation. ```{tweet}```",
     )
@@ -5,9 +5,12 @@ from typing import Optional
 
 from fastapi import HTTPException, UploadFile
 
+from src.utils import save_upload
+
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif"}
 ALLOWED_VIDEO_TYPES = {"video/mp4", "video/webm"}
 MAX_FILE_SIZE = 100 * 1024 * 1024
+MAX_TWEET_LENGTH = 280
 
 
 async def save_tweet_media(
@@ -40,9 +43,7 @@ async def save_tweet_media(
     file_path = media_dir / unique_filename
 
     try:
-        contents = await media.read()
-        with open(file_path, "wb") as f:
-            f.write(contents)
+        await save_upload(media, file_path)
         return str(file_path)
     except Exception as e:
         raise HTTPException(
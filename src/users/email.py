@@ -26,46 +26,54 @@ email_conf = ConnectionConfig(
 email_service = FastMail(email_conf)
 
 
-async def send_account_verification_email(
+def send_account_verification_email(
     user: User,
     background_tasks: BackgroundTasks,
 ):
-    token = user_utils.create_url_safe_token(user.email)
+    # Only primitives are handed to the task, and the token and message are
+    # built there, so the request handler does no email work of its own.
+    background_tasks.add_task(
+        _send_account_verification_email, user.email, user.username
+    )
+
+
+async def _send_account_verification_email(email: str, username: str):
+    token = user_utils.create_url_safe_token(email)
     subject = f"Account Verification - {settings.app_name}"
     activation_url = f"http://{settings.domain}/users/verify/{token}"
     data = {
         "app_name": f"{settings.app_name}",
-        "name": user.username,
+        "name": username,
         "activation_url": activation_url,
     }
     message = MessageSchema(
-        recipients=[user.email],
+        recipients=[email],
         subject=subject,
         template_body=data,
         subtype=MessageType.html,
     )
-    background_tasks.add_task(
-        email_service.send_message, message, template_name="user-verification.html"
-    )
-    return
+    await email_service.send_message(message, template_name="user-verification.html")
 
 
-async def send_account_activation_confirmation_email(
+def send_account_activation_confirmation_email(
     user: User, background_tasks: BackgroundTasks
 ):
+    background_tasks.add_task(
+        _send_account_activation_confirmation_email, user.email, user.username
+    )
+
+
+async def _send_account_activation_confirmation_email(email: str, username: str):
     data = {
         "app_name": settings.app_name,
-        "name": user.username,
+        "name": username,
         "login_url": f"http://localhost:4200",
     }
     subject = f"Welcome - {settings.app_name}"
     message = MessageSchema(
-        recipients=[user.email],
+        recipients=[email],
         subject=subject,
         template_body=data,
         subtype=MessageType.html,
     )
-    background_tasks.add_task(
-        email_service.send_message, message, template_name="verification-success.html"
-    )
-    return
+    await email_service.send_message(message, template_name="verification-success.html")
@@ -5,11 +5,11 @@ from typing import Annotated, Optional
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, UploadFile, status
 from fastapi.responses import JSONResponse
 from pydantic import StringConstraints
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import models
 from src.database import get_db
-from src.dependencies import get_current_user
+from src.dependencies import CurrentUser, get_current_user, get_current_user_model
 from src.users import schemas, service
 
 router = APIRouter(prefix="/users", tags=["Users"])
@@ -21,7 +21,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 async def create_user_account(
     user: schemas.UserCreate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new user account.
 
@@ -33,7 +33,7 @@ async def create_user_account(
             username, and full name.
         background_tasks (BackgroundTasks): FastAPI background tasks manager for
             sending verification email.
-        db (Session): Database session instance.
+        db (AsyncSession): Database session instance.
 
     Returns:
         CreateUserResponse: Newly created user details with success message.
@@ -73,8 +73,8 @@ async def update_user_account(
     birth_date: Annotated[datetime.date, Form()] = None,
     profile_image: Annotated[Optional[UploadFile], File()] = None,
     header_image: Annotated[Optional[UploadFile], File()] = None,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
 ):
     """Update authenticated user's profile information.
 
@@ -89,8 +89,8 @@ async def update_user_account(
         birth_date (datetime.date, optional): New birth date.
         profile_image (UploadFile, optional): New profile picture to upload.
         header_image (UploadFile, optional): New header/banner image to upload.
-        current_user (models.User): The authenticated user making the update.
-        db (Session): Database session instance.
+        current_user (CurrentUser): The authenticated user making the update.
+        db (AsyncSession): Database session instance.
 
     Returns:
         UpdateUserResponse: Updated user profile information.
@@ -134,7 +134,7 @@ async def update_user_account(
 
 @router.get("/verify/{token}", status_code=status.HTTP_200_OK)
 async def verify_user(
-    token: str, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+    token: str, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)
 ):
     """Verify user's email address using the verification token.
 
@@ -145,7 +145,7 @@ async def verify_user(
         token (str): Email verification token from the verification link.
         background_tasks (BackgroundTasks): FastAPI background tasks manager for
             sending confirmation email.
-        db (Session): Database session instance.
+        db (AsyncSession): Database session instance.
 
     Returns:
         JSONResponse: Success message upon verification.
@@ -175,7 +175,8 @@ async def verify_user(
     response_model=schemas.CurrentUserDetailsResponse,
 )
 async def get_current_user_details(
-    current_user: models.User = Depends(get_current_user), db: Session = Depends(get_db)
+    current_user: models.User = Depends(get_current_user_model),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get detailed profile information for the authenticated user.
 
@@ -184,7 +185,7 @@ async def get_current_user_details(
 
     Args:
         current_user (models.User): The authenticated user requesting their details.
-        db (Session): Database session instance.
+        db (AsyncSession): Database session instance.
 
     Returns:
         CurrentUserDetailsResponse: Complete user profile information.
@@ -226,8 +227,8 @@ async def get_current_user_details(
 )
 async def get_user_details(
     user_id: uuid.UUID,
-    db: Session = Depends(get_db),
-    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
     """Get information of a specific user.
 
@@ -236,8 +237,8 @@ async def get_user_details(
 
     Args:
         user_id (uuid.UUID): ID of the user whose details are being requested.
-        db (Session): Database session instance.
-        current_user (models.User): The authenticated user making the request.
+        db (AsyncSession): Database session instance.
+        current_user (CurrentUser): The authenticated user making the request.
 
     Returns:
         UserDetailsResponse: User profile information and relationship status.
@@ -65,7 +65,7 @@ class UserDetailsBase(BaseModel):
     location: str | None = None
     profile_image_url: str | None = None
     header_image_url: str | None = None
-    verified_on: datetime.datetime
+    verified_on: datetime.datetime | None = None
     num_followers: int | None = -1
     num_following: int | None = -1
     tweet_count: int | None = -1
@@ -3,9 +3,9 @@ import uuid
 from datetime import datetime
 
 from fastapi import BackgroundTasks, HTTPException, UploadFile
-from sqlalchemy import func
+from sqlalchemy import exists, func, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import models, utils
 from src.logger import get_logger
@@ -25,51 +25,64 @@ from src.users.schemas import UserCreate
 logger = get_logger()
 
 
-async def get_user_details(user_id: uuid.UUID, current_user_id: uuid.UUID, db: Session):
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+async def get_user_details(
+    user_id: uuid.UUID, current_user_id: uuid.UUID, db: AsyncSession
+):
+    user = await db.get(models.User, user_id)
 
     if not user:
         raise UserNotFound
-    is_followed = (
-        db.query(models.Follow)
-        .filter(
-            models.Follow.follower_id == current_user_id,
-            models.Follow.followed_id == user_id,
+    is_followed = await db.scalar(
+        select(
+            exists().where(
+                models.Follow.follower_id == current_user_id,
+                models.Follow.followed_id == user_id,
+            )
         )
-        .first()
-        is not None
     )
     return user, is_followed
 
 
-async def create_user_account(new_user: UserCreate, db: Session, background_tasks):
-    user_exists = (
-        db.query(models.User).filter(models.User.email == new_user.email).first()
+async def create_user_account(new_user: UserCreate, db: AsyncSession, background_tasks):
+    user_exists = await db.scalar(
+        select(exists().where(models.User.email == new_user.email))
     )
     if user_exists:
         logger.warning(f"Account creation failed: Email {new_user.email} already taken")
         raise EmailTakenException
     # token = user_utils.generate_token(user.email)
-    hashed_password = utils.hash(new_user.password)
-    new_user.password = hashed_password
-    new_user = models.User(**new_user.model_dump(), verified_on=None)
+    new_user = models.User(
+        username=new_user.username,
+        email=new_user.email,
+        password=utils.hash(new_user.password),
+        full_name=new_user.full_name,
+        bio=new_user.bio,
+        location=new_user.location,
+        birth_date=new_user.birth_date,
+        verified_on=None,
+    )
     try:
         db.add(new_user)
-        db.commit()
+        await db.commit()
     except IntegrityError:
+        await db.rollback()
         logger.warning(
             f"Account creation failed: Username {new_user.username} already taken"
         )
         raise UsernameTakenException
-    db.refresh(new_user)
+    # created_at comes back through the INSERT's RETURNING clause.
     logger.info(f"New user account created successfully: {new_user.email}")
-    await send_account_verification_email(new_user, background_tasks)
+    send_account_verification_email(new_user, background_tasks)
     return new_user
 
 
-async def activate_user_account(token, db: Session, background_tasks: BackgroundTasks):
+async def activate_user_account(
+    token, db: AsyncSession, background_tasks: BackgroundTasks
+):
     decoded_email = user_utils.decode_url_safe_token(token)
-    user = db.query(models.User).filter(models.User.email == decoded_email).first()
+    user = (
+        await db.execute(select(models.User).where(models.User.email == decoded_email))
+    ).scalar_one_or_none()
     if not user:
         logger.warning(
             f"Account activation failed: User with email {decoded_email} not found"
@@ -77,10 +90,9 @@ async def activate_user_account(token, db: Session, background_tasks: Background
         raise UserNotFound
     user.verified_on = datetime.now()
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
     logger.info(f"User account activated successfully: {user.email}")
-    await send_account_activation_confirmation_email(user, background_tasks)
+    send_account_activation_confirmation_email(user, background_tasks)
     return user
 
 
@@ -93,14 +105,14 @@ async def update_user_details(
     profile_image,
     header_image,
     current_user_id,
-    db: Session,
+    db: AsyncSession,
 ):
-    user = db.query(models.User).filter(models.User.id == current_user_id).first()
+    user = await db.get(models.User, current_user_id)
     if not user:
         logger.warning(f"User update failed: User with id {current_user_id} not found")
         raise UserNotFound
     if username is not None:
-        if db.query(models.User).filter(models.User.username == username).first():
+        if await db.scalar(select(exists().where(models.User.username == username))):
             logger.warning(f"User update failed: Username {username} already taken")
             raise UsernameTakenException
     if username:
@@ -116,24 +128,23 @@ async def update_user_details(
 
     if profile_image:
         profile_image_path = await save_image(profile_image, "profile-images")
-        user.profile_image_url = "http://localhost:8000/" + profile_image_path
+        user.profile_image_url = utils.public_url(profile_image_path)
 
     if header_image:
         header_image_path = await save_image(header_image, "header-images")
-        user.header_image_url = "http://localhost:8000/" + header_image_path
+        user.header_image_url = utils.public_url(header_image_path)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
     logger.info(f"User details updated successfully for user: {user.email}")
     return user
 
 
 async def get_follow_stats(user_id, db):
-    num_followers = (
-        db.query(models.Follow).filter(models.Follow.followed_id == user_id).count()
+    num_followers = await db.scalar(
+        select(func.count()).where(models.Follow.followed_id == user_id)
     )
-    num_following = (
-        db.query(models.Follow).filter(models.Follow.follower_id == user_id).count()
+    num_following = await db.scalar(
+        select(func.count()).where(models.Follow.follower_id == user_id)
     )
     return {"num_followers": num_followers, "num_following": num_following}
 
@@ -150,26 +161,20 @@ async def save_image(file: UploadFile, folder: str) -> str:
     file_name = f"{uuid.uuid4()}.{file_ext}"
     file_path = os.path.join(upload_dir, file_name)
 
-    with open(file_path, "wb") as f:
-        content = await file.read()
-        f.write(content)
+    await utils.save_upload(file, file_path)
 
     return os.path.join("static", folder, file_name)
 
 
-async def get_user_total_tweet_count(db: Session, user_id: uuid.UUID) -> int:
+async def get_user_total_tweet_count(db: AsyncSession, user_id: uuid.UUID) -> int:
     """
     Get the total number of tweets, retweets, and replies for a user
     """
-    tweet_count = (
-        db.query(func.count(models.Tweet.id))
-        .filter(models.Tweet.user_id == user_id)
-        .scalar()
+    tweet_count = await db.scalar(
+        select(func.count(models.Tweet.id)).where(models.Tweet.user_id == user_id)
     )
 
-    retweet_count = (
-        db.query(func.count(models.Retweet.id))
-        .filter(models.Retweet.user_id == user_id)
-        .scalar()
+    retweet_count = await db.scalar(
+        select(func.count(models.Retweet.id)).where(models.Retweet.user_id == user_id)
     )
     return tweet_count + retweet_count
@@ -3,19 +3,17 @@ from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 from src.config import settings
 from src.users.exceptions import BadSignature, VerificationLinkExpired
 
+_serializer = URLSafeTimedSerializer(settings.secret_key)
+_SALT = settings.security_salt
 
-def create_url_safe_token(email):
-    serializer = URLSafeTimedSerializer(settings.secret_key)
 
-    return serializer.dumps(email, salt=settings.security_salt)
+def create_url_safe_token(email):
+    return _serializer.dumps(email, salt=_SALT)
 
 
 def decode_url_safe_token(token, expiration=3600):
-    serializer = URLSafeTimedSerializer(secret_key=settings.secret_key)
     try:
-        token_data = serializer.loads(
-            token, salt=settings.security_salt, max_age=expiration
-        )
+        token_data = _serializer.loads(token, salt=_SALT, max_age=expiration)
         return token_data
     except SignatureExpired:
         raise BadSignature
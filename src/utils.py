@@ -1,6 +1,27 @@
+import base64
+import binascii
+import shutil
+import uuid
+from datetime import datetime
+
+from fastapi import UploadFile
 from passlib.context import CryptContext
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
+
+from src.config import settings
+from src.exceptions import InvalidCursor
+
+# Pinned so a passlib default bump can't silently change the per-login CPU
+# cost; hashes made with other rounds are upgraded on the next login.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# PostgreSQL SQLSTATE for foreign_key_violation.
+_FOREIGN_KEY_VIOLATION = "23503"
+
+# Uploads are copied in fixed-size chunks, so memory per upload stays flat
+# whatever the file size.
+_UPLOAD_CHUNK_SIZE = 1 << 20
 
 
 def hash(password: str):
@@ -9,3 +30,47 @@ def hash(password: str):
 
 def verify(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update(plain_password, hashed_password):
+    """Verify a password, returning (valid, new_hash).
+
+    new_hash is set when the stored hash uses outdated parameters and should
+    be replaced; otherwise it is None.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def is_foreign_key_violation(exc: IntegrityError) -> bool:
+    """Whether `exc` was raised by a foreign key check rather than another constraint."""
+    return getattr(exc.orig, "pgcode", None) == _FOREIGN_KEY_VIOLATION
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe string."""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor, raising InvalidCursor if malformed."""
+    try:
+        created_at, id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor
+
+
+def _copy_to_file(source, path):
+    with open(path, "wb") as f:
+        shutil.copyfileobj(source, f, _UPLOAD_CHUNK_SIZE)
+
+
+def public_url(path: str) -> str:
+    """Return the URL clients fetch a stored upload from."""
+    return f"{settings.media_base_url}/{path}"
+
+
+async def save_upload(upload: UploadFile, path) -> None:
+    """Stream `upload` to `path` in chunks, with the disk writes in a worker thread."""
+    await run_in_threadpool(_copy_to_file, upload.file, path)
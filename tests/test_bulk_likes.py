@@ -0,0 +1,48 @@
+import uuid
+
+from conftest import new_user
+
+from src.like import service
+from src.models import Like, Tweet
+from src.tweets import service as tweets_service
+
+
+def _seed(pg, owner, likers, like_count=0):
+    (tweet,) = pg.add(Tweet(user_id=owner.id, content="liked", like_count=like_count))
+    users = pg.add(*(new_user(f"liker{i}") for i in range(likers)))
+    return tweet, users
+
+
+def test_bulk_import_skips_duplicates_and_missing_rows(pg, pg_user):
+    tweet, (already, fresh) = _seed(pg, pg_user, 2, like_count=1)
+    pg.add(Like(tweet_id=tweet.id, user_id=already.id))
+    version = tweets_service._home_feed_version
+
+    pairs = [
+        (tweet.id, already.id),
+        (tweet.id, fresh.id),
+        (tweet.id, fresh.id),
+        (uuid.uuid4(), fresh.id),
+        (tweet.id, uuid.uuid4()),
+    ]
+    assert pg.run(lambda db: service.bulk_create_likes(pairs, db)) == 1
+    assert pg.get(Tweet, tweet.id).like_count == 2
+    assert tweets_service._home_feed_version > version
+
+
+def test_bulk_import_stages_large_batches_with_copy(pg, pg_user, monkeypatch):
+    count = service._COPY_THRESHOLD + 1
+    tweet, users = _seed(pg, pg_user, count)
+    staged = []
+
+    async def stage_likes(pairs, db):
+        staged.append(len(pairs))
+        return await original(pairs, db)
+
+    original = service._stage_likes
+    monkeypatch.setattr(service, "_stage_likes", stage_likes)
+
+    pairs = [(tweet.id, user.id) for user in users]
+    assert pg.run(lambda db: service.bulk_create_likes(pairs, db)) == count
+    assert staged == [count]
+    assert pg.get(Tweet, tweet.id).like_count == count
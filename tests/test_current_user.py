@@ -0,0 +1,37 @@
+import time
+
+import jwt
+
+from src.config import settings
+from src.dependencies import get_current_user
+
+
+def _token(email, expires_in):
+    payload = {"user_id": email, "exp": int(time.time()) + expires_in}
+    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+
+
+def test_expired_token_rejected_while_cached(client, verified_user):
+    headers = {"Authorization": f"Bearer {_token(verified_user.email, 1)}"}
+
+    # The first request caches both the decoded token and the current user.
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    time.sleep(2)
+    assert client.get("/users/me", headers=headers).status_code == 401
+
+
+def test_unknown_user_rejected(client):
+    headers = {"Authorization": f"Bearer {_token('nobody@example.com', 60)}"}
+    assert client.get("/follow/followers", headers=headers).status_code == 401
+
+
+def test_cache_clear_for_drops_cached_user(client, test_session, verified_user):
+    token = _token(verified_user.email, 60)
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/follow/followers", headers=headers).status_code == 200
+
+    test_session.delete(verified_user)
+    test_session.commit()
+    get_current_user.cache_clear_for(token)
+    assert client.get("/follow/followers", headers=headers).status_code == 401
@@ -0,0 +1,84 @@
+import uuid
+from datetime import datetime, timezone
+
+from conftest import new_user, seed_timeline, walk_pages
+
+from src.models import Follow, User
+from src.utils import decode_cursor, encode_cursor, hash
+
+
+def _seed_followers(test_session, user, count):
+    followers = [
+        User(
+            username=f"follower{i}",
+            full_name=f"Follower {i}",
+            email=f"follower{i}@example.com",
+            password=hash("password"),
+        )
+        for i in range(count)
+    ]
+    test_session.add_all(followers)
+    test_session.flush()
+    follows = seed_timeline(
+        test_session,
+        lambda i, created_at: Follow(
+            follower_id=followers[i].id, followed_id=user.id, created_at=created_at
+        ),
+        count,
+    )
+    return [str(follow.follower_id) for follow in follows]
+
+
+def test_cursor_round_trip():
+    position = (datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc), uuid.uuid4())
+    assert decode_cursor(encode_cursor(*position)) == position
+
+
+def test_followers_walks_cursor_to_the_end(auth_client, test_session, verified_user):
+    expected = _seed_followers(test_session, verified_user, 5)
+
+    seen = walk_pages(
+        auth_client,
+        "/follow/followers",
+        {"limit": 2},
+        lambda response: [user["id"] for user in response.json()["followers"]],
+        lambda response: response.json()["next_cursor"],
+    )
+    assert seen == expected
+
+    response = auth_client.get("/follow/followers", params={"count_only": True})
+    assert response.json() == {"count": 5}
+
+
+def test_followers_rejects_malformed_cursor(auth_client):
+    response = auth_client.get(
+        "/follow/followers", params={"cursor": "bm90IGEgY3Vyc29y"}
+    )
+    assert response.status_code == 400
+
+
+def test_followers_of_unknown_user(auth_client):
+    response = auth_client.get(
+        "/follow/followers", params={"user_id": str(uuid.uuid4())}
+    )
+    assert response.status_code == 404
+
+
+def test_follow_and_unfollow(pg_client, pg, pg_user):
+    (other,) = pg.add(new_user("other"))
+    followers = {"user_id": str(other.id), "count_only": True}
+
+    assert pg_client.post(f"/follow/{other.id}").status_code == 201
+    assert pg_client.post(f"/follow/{other.id}").status_code == 400
+    assert pg_client.get("/follow/followers", params=followers).json() == {"count": 1}
+
+    assert pg_client.delete(f"/follow/{other.id}").status_code == 200
+    assert pg_client.delete(f"/follow/{other.id}").status_code == 400
+    assert pg_client.get("/follow/followers", params=followers).json() == {"count": 0}
+
+
+def test_follow_missing_or_self(pg_client, pg_user):
+    missing = uuid.uuid4()
+    assert pg_client.post(f"/follow/{missing}").status_code == 404
+    assert pg_client.delete(f"/follow/{missing}").status_code == 404
+    assert pg_client.post(f"/follow/{pg_user.id}").status_code == 400
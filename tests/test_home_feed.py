@@ -0,0 +1,47 @@
+import uuid
+from collections import namedtuple
+from datetime import datetime
+
+from conftest import seed_timeline, walk_pages
+
+from src.models import Tweet
+from src.tweets.service import _trim_page
+from src.utils import decode_cursor
+
+Row = namedtuple("Row", "created_at id")
+
+
+def test_trim_page_splits_off_the_probe_row():
+    rows = [Row(datetime(2026, 1, 1, minute=m), uuid.uuid4()) for m in (3, 2, 1)]
+
+    page, next_cursor = _trim_page(rows, 2, lambda row: row)
+    assert page == rows[:2]
+    assert decode_cursor(next_cursor) == tuple(rows[1])
+
+    page, next_cursor = _trim_page(rows, 3, lambda row: row)
+    assert page == rows
+    assert next_cursor is None
+
+
+def test_home_feed_walks_cursor_to_the_end(auth_client, test_session, verified_user):
+    tweets = seed_timeline(
+        test_session,
+        lambda i, created_at: Tweet(
+            user_id=verified_user.id, content=f"tweet {i}", created_at=created_at
+        ),
+        5,
+    )
+
+    seen = walk_pages(
+        auth_client,
+        "/tweets/home",
+        {"limit": 2},
+        lambda response: [tweet["id"] for tweet in response.json()],
+        lambda response: response.headers.get("X-Next-Cursor"),
+    )
+    assert seen == [str(tweet.id) for tweet in tweets]
+
+
+def test_home_feed_rejects_malformed_cursor(auth_client):
+    response = auth_client.get("/tweets/home", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
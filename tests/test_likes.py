@@ -0,0 +1,47 @@
+import uuid
+
+from conftest import auth_headers, new_user
+
+from src.models import Tweet
+
+
+def _tweet(pg, user):
+    (tweet,) = pg.add(Tweet(user_id=user.id, content="likeable"))
+    return tweet
+
+
+def test_like_twice_is_rejected(pg_client, pg, pg_user):
+    tweet = _tweet(pg, pg_user)
+
+    assert pg_client.post("/likes", json={"tweet_id": str(tweet.id)}).status_code == 201
+    assert pg_client.post("/likes", json={"tweet_id": str(tweet.id)}).status_code == 400
+
+
+def test_like_missing_tweet(pg_client):
+    response = pg_client.post("/likes", json={"tweet_id": str(uuid.uuid4())})
+    assert response.status_code == 404
+
+
+def test_unlike_without_like(pg_client, pg, pg_user):
+    tweet = _tweet(pg, pg_user)
+
+    assert pg_client.delete(f"/likes/{tweet.id}").status_code == 404
+    assert pg_client.delete(f"/likes/{uuid.uuid4()}").status_code == 404
+
+
+def test_like_counter_follows_writes(pg_client, pg, pg_user):
+    tweet = _tweet(pg, pg_user)
+    (other,) = pg.add(new_user("other"))
+    body = {"tweet_id": str(tweet.id)}
+
+    assert pg_client.post("/likes", json=body).json()["like_count"] == 1
+    response = pg_client.post("/likes", json=body, headers=auth_headers(other))
+    assert response.json()["like_count"] == 2
+
+    # A rejected duplicate leaves the counter alone.
+    pg_client.post("/likes", json=body)
+    assert pg.get(Tweet, tweet.id).like_count == 2
+
+    assert pg_client.delete(f"/likes/{tweet.id}").json() == {"like_count": 1}
+    pg_client.delete(f"/likes/{tweet.id}")
+    assert pg.get(Tweet, tweet.id).like_count == 1
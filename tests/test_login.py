@@ -1,6 +1,8 @@
 import pytest
 from conftest import USER_EMAIL, USER_PASSWORD
 
+from src.utils import pwd_context
+
 
 def test_successful_login(client, verified_user):
     response = client.post(
@@ -30,3 +32,23 @@ def test_unsuccessful_login(client, verified_user, email, password, status_code)
         },
     )
     assert response.status_code == status_code
+
+
+def test_login_upgrades_outdated_hash(client, test_session, verified_user):
+    outdated = pwd_context.copy(bcrypt__rounds=4).hash(USER_PASSWORD)
+    verified_user.password = outdated
+    test_session.commit()
+
+    response = client.post(
+        "/login",
+        data={
+            "username": verified_user.email,
+            "password": USER_PASSWORD,
+        },
+    )
+    assert response.status_code == 200
+
+    test_session.refresh(verified_user)
+    assert verified_user.password != outdated
+    assert not pwd_context.needs_update(verified_user.password)
+    assert pwd_context.verify(USER_PASSWORD, verified_user.password)
@@ -0,0 +1,47 @@
+import uuid
+
+from conftest import auth_headers, new_user
+
+from src.models import Tweet
+
+
+def _tweet(pg, user):
+    (tweet,) = pg.add(Tweet(user_id=user.id, content="retweetable"))
+    return tweet
+
+
+def test_retweet_twice_is_rejected(pg_client, pg, pg_user):
+    tweet = _tweet(pg, pg_user)
+
+    response = pg_client.post("/retweets", json={"tweet_id": str(tweet.id)})
+    assert response.status_code == 201
+    assert response.json()["user_id"] == str(pg_user.id)
+    response = pg_client.post("/retweets", json={"tweet_id": str(tweet.id)})
+    assert response.status_code == 400
+
+
+def test_retweet_missing_tweet(pg_client):
+    response = pg_client.post("/retweets", json={"tweet_id": str(uuid.uuid4())})
+    assert response.status_code == 404
+
+
+def test_unretweet_without_retweet(pg_client, pg, pg_user):
+    tweet = _tweet(pg, pg_user)
+
+    assert pg_client.delete(f"/retweets/{tweet.id}").status_code == 404
+    assert pg_client.delete(f"/retweets/{uuid.uuid4()}").status_code == 404
+
+
+def test_retweet_counter_follows_writes(pg_client, pg, pg_user):
+    tweet = _tweet(pg, pg_user)
+    (other,) = pg.add(new_user("other"))
+    body = {"tweet_id": str(tweet.id)}
+
+    pg_client.post("/retweets", json=body)
+    pg_client.post("/retweets", json=body, headers=auth_headers(other))
+    pg_client.post("/retweets", json=body)
+    assert pg.get(Tweet, tweet.id).retweet_count == 2
+
+    pg_client.delete(f"/retweets/{tweet.id}")
+    pg_client.delete(f"/retweets/{tweet.id}")
+    assert pg.get(Tweet, tweet.id).retweet_count == 1
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from conftest import seed_timeline, walk_pages
+
+from src.models import Tweet
+
+
+def _seed_replies(test_session, user, count):
+    parent = Tweet(user_id=user.id, content="parent", created_at=datetime(2025, 1, 1))
+    test_session.add(parent)
+    test_session.flush()
+    replies = seed_timeline(
+        test_session,
+        lambda i, created_at: Tweet(
+            user_id=user.id,
+            content=f"reply {i}",
+            parent_tweet_id=parent.id,
+            created_at=created_at,
+        ),
+        count,
+    )
+    return parent.id, [str(reply.id) for reply in replies]
+
+
+def test_replies_walk_cursor_to_the_end(auth_client, test_session, verified_user):
+    parent_id, expected = _seed_replies(test_session, verified_user, 5)
+
+    seen = walk_pages(
+        auth_client,
+        f"/tweets/{parent_id}",
+        {"reply_limit": 2},
+        lambda response: response.json()["reply_ids"],
+        lambda response: response.json()["next_reply_cursor"],
+        cursor_param="reply_cursor",
+    )
+    assert seen == expected
+
+
+def test_replies_page_by_offset_without_cursor(
+    auth_client, test_session, verified_user
+):
+    parent_id, expected = _seed_replies(test_session, verified_user, 5)
+
+    response = auth_client.get(
+        f"/tweets/{parent_id}", params={"reply_skip": 2, "reply_limit": 2}
+    )
+    assert response.status_code == 200
+    assert response.json()["reply_ids"] == expected[2:4]
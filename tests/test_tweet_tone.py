@@ -0,0 +1,40 @@
+import pytest
+from conftest import AsyncSessionTesting
+
+from src.tweets import service
+
+
+@pytest.fixture
+def rewrite(monkeypatch):
+    """Point the background rewrite at the test database and a fake model."""
+    replies = {}
+
+    async def change_tweet_tone(tweet, tone, parent_tweet=None):
+        return replies.get("text", f"{tone}: {tweet}")
+
+    monkeypatch.setattr(service, "SessionLocal", AsyncSessionTesting)
+    monkeypatch.setattr(service, "change_tweet_tone", change_tweet_tone)
+    return replies
+
+
+def test_tone_request_is_accepted_then_rewritten(auth_client, rewrite):
+    response = auth_client.post("/tweets", data={"content": "hi", "tone": "formal"})
+    assert response.status_code == 202
+    tweet = response.json()["data"]
+    assert tweet["status"] == "pending_tone"
+    assert tweet["content"] == "hi"
+
+    # TestClient runs background tasks before returning the response.
+    tweet = auth_client.get(f"/tweets/{tweet['id']}").json()
+    assert tweet["status"] == "ready"
+    assert tweet["content"] == "formal: hi"
+
+
+def test_overlong_rewrite_keeps_original(auth_client, rewrite):
+    rewrite["text"] = "x" * 281
+    response = auth_client.post("/tweets", data={"content": "hi", "tone": "formal"})
+    assert response.status_code == 202
+
+    tweet = auth_client.get(f"/tweets/{response.json()['data']['id']}").json()
+    assert tweet["status"] == "ready"
+    assert tweet["content"] == "hi"
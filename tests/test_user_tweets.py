@@ -0,0 +1,32 @@
+from conftest import seed_timeline, walk_pages
+
+from src.models import Retweet, Tweet
+
+
+def test_user_tweets_walk_cursor_to_the_end(auth_client, test_session, verified_user):
+    tweets = seed_timeline(
+        test_session,
+        lambda i, created_at: Tweet(
+            user_id=verified_user.id, content=f"tweet {i}", created_at=created_at
+        ),
+        4,
+    )
+    # A retweet lists at its own time, ahead of every original here.
+    (retweet,) = seed_timeline(
+        test_session,
+        lambda i, created_at: Retweet(
+            tweet_id=tweets[-1].id,
+            user_id=verified_user.id,
+            created_at=created_at.replace(year=2027),
+        ),
+        1,
+    )
+
+    seen = walk_pages(
+        auth_client,
+        f"/tweets/users/{verified_user.id}/tweets",
+        {"limit": 2},
+        lambda response: [tweet["id"] for tweet in response.json()["tweets"]],
+        lambda response: response.json()["next_cursor"],
+    )
+    assert seen == [str(retweet.tweet_id)] + [str(tweet.id) for tweet in tweets]